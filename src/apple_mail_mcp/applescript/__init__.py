@@ -1,15 +1,17 @@
 """AppleScript execution utilities."""
 
-from .escape import RECORD_SEP, UNIT_SEP, GROUP_SEP, escape_applescript_string, esc
-from .executor import AppleScriptExecutor
+from .escape import RECORD_SEP, UNIT_SEP, GROUP_SEP, escape_applescript_string, esc, split_rows
+from .executor import AppleScriptExecutor, get_executor
 from .scripts import Scripts
 
 __all__ = [
     "AppleScriptExecutor",
+    "get_executor",
     "Scripts",
     "RECORD_SEP",
     "UNIT_SEP",
     "GROUP_SEP",
     "escape_applescript_string",
     "esc",
+    "split_rows",
 ]
@@ -2,12 +2,34 @@
 
 from __future__ import annotations
 
+import functools
+import logging
+import re
+
 # Delimiter constants - using ASCII control characters to avoid collision with email content
 # These characters are extremely unlikely to appear in email subjects, bodies, or sender names
 RECORD_SEP = chr(30)  # Record Separator - separates fields within a record
 UNIT_SEP = chr(31)    # Unit Separator - separates message fields (like |||FIELD|||)
 GROUP_SEP = chr(29)   # Group Separator - separates messages (like |||MSG|||)
 
+logger = logging.getLogger(__name__)
+
+# Characters that must be escaped inside AppleScript string literals
+_ESCAPES = {
+    "\\": "\\\\",
+    '"': '\\"',
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+}
+
+# Single-pass translation table built from _ESCAPES. Each character maps
+# independently, so backslashes are never double-escaped.
+_ESCAPE_TABLE = str.maketrans(_ESCAPES)
+
+# Matches any character that needs escaping; most inputs contain none of them
+_SPECIAL_RE = re.compile("[" + re.escape("".join(_ESCAPES)) + "]")
+
 
 def escape_applescript_string(value: str | None) -> str:
     """
@@ -25,19 +47,55 @@ def escape_applescript_string(value: str | None) -> str:
     if value is None:
         return ""
 
-    # Escape backslashes first (must be first to avoid double-escaping)
-    result = value.replace("\\", "\\\\")
-    # Escape double quotes
-    result = result.replace('"', '\\"')
-    # Escape tabs
-    result = result.replace("\t", "\\t")
-    # Escape newlines
-    result = result.replace("\n", "\\n")
-    # Escape carriage returns
-    result = result.replace("\r", "\\r")
+    # Fast path: clean strings (account names, "INBOX", ...) are returned as-is
+    if _SPECIAL_RE.search(value) is None:
+        return value
 
-    return result
+    return value.translate(_ESCAPE_TABLE)
 
 
 # Short alias for convenience in scripts.py
 esc = escape_applescript_string
+
+
+@functools.lru_cache(maxsize=None)
+def _rows_re(width: int) -> re.Pattern:
+    """Pattern matching output made only of rows with exactly width fields."""
+    row = f"(?:[^{RECORD_SEP}\n]*{RECORD_SEP}){{{width - 1}}}[^{RECORD_SEP}\n]*"
+    return re.compile(f"{row}(?:\n{row})*")
+
+
+def split_rows(output: str, width: int) -> list[str]:
+    """
+    Split RECORD_SEP/linefeed rows into one flat list of fields.
+
+    Rows are read with a stride: field k of row r is at index r * width + k.
+    When every row has width fields (checked with one regex match) the whole
+    output is split at once, which avoids a list and a string per line.
+    Otherwise rows with a different number of fields are logged and dropped.
+
+    Args:
+        output: Script output, one row of width fields per line
+        width: Number of fields per row
+
+    Returns:
+        Flat list of fields whose length is a multiple of width
+    """
+    output = output.strip("\n")
+    if not output:
+        return []
+
+    if _rows_re(width).fullmatch(output):
+        return output.replace("\n", RECORD_SEP).split(RECORD_SEP)
+
+    # A row with a stray separator or missing fields: keep the well-formed rows
+    flat = []
+    for line in output.split("\n"):
+        parts = line.split(RECORD_SEP)
+        if len(parts) == width:
+            flat.extend(parts)
+        else:
+            logger.warning(
+                "Dropped a row with %d fields (expected %d): %r", len(parts), width, line[:200]
+            )
+    return flat
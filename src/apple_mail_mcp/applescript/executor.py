@@ -1,11 +1,23 @@
 """AppleScript execution via osascript subprocess."""
 
+import asyncio
+import hashlib
 import logging
+import os
+import selectors
 import subprocess
-from typing import Optional
+import threading
+import time
+from typing import Iterator, Optional
+
+from . import runner
+from .escape import esc
 
 logger = logging.getLogger(__name__)
 
+# Compiled copies of run_compiled() scripts, named by a hash of their source
+COMPILED_DIR = os.path.expanduser("~/Library/Caches/apple-mail-mcp/scripts")
+
 
 class AppleScriptError(Exception):
     """Raised when AppleScript execution fails."""
@@ -16,6 +28,27 @@ class AppleScriptError(Exception):
 class AppleScriptExecutor:
     """Executes AppleScript code via osascript."""
 
+    def __init__(self, in_process: bool = False):
+        """
+        Args:
+            in_process: Compile and run AppleScript in this process with
+                NSAppleScript (requires PyObjC) instead of spawning osascript.
+                Ignored with a warning when PyObjC is not installed. The
+                timeout is not enforced for in-process scripts.
+        """
+        self.in_process = in_process and runner.available()
+        if in_process and not self.in_process:
+            logger.warning("PyObjC not available, using osascript instead of NSAppleScript")
+        # NSAppleScript is not thread-safe, so in-process calls must not interleave
+        self._lock = threading.Lock()
+        self._compiled: dict[str, str] = {}
+        self._compile_lock = threading.Lock()
+
+    @property
+    def parallel(self) -> bool:
+        """Whether scripts run from different threads execute at the same time."""
+        return not self.in_process
+
     def run(self, script: str, timeout: int = 30) -> str:
         """
         Execute an AppleScript and return the result.
@@ -30,29 +63,253 @@ class AppleScriptExecutor:
         Raises:
             AppleScriptError: If the script fails or times out
         """
-        logger.debug("Executing AppleScript:\n%s", script)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing AppleScript:\n%s", script)
+
+        if self.in_process:
+            return self._run_in_process(script)
 
         try:
+            # Feed the script through stdin: no ARG_MAX limit for large bulk scripts
+            # Capture raw bytes and decode once: text=True would also run a
+            # universal-newlines pass over the whole (possibly huge) output
             result = subprocess.run(
-                ["osascript", "-e", script],
+                ["osascript", "-"],
+                input=script.encode("utf-8"),
                 capture_output=True,
-                text=True,
                 timeout=timeout,
             )
 
             if result.returncode != 0:
-                error_msg = result.stderr.strip() or "Unknown AppleScript error"
+                error_msg = (
+                    result.stderr.decode("utf-8", errors="replace").strip()
+                    or "Unknown AppleScript error"
+                )
                 logger.error("AppleScript failed: %s", error_msg)
                 raise AppleScriptError(error_msg)
 
-            output = result.stdout.strip()
-            logger.debug("AppleScript result: %s", output[:500] if output else "(empty)")
+            output = result.stdout.strip().decode("utf-8", errors="replace")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("AppleScript result: %s", output[:500] if output else "(empty)")
             return output
 
         except subprocess.TimeoutExpired:
             logger.error("AppleScript timed out after %d seconds", timeout)
             raise AppleScriptError(f"Script timed out after {timeout} seconds")
 
+    async def run_async(self, script: str, timeout: int = 30) -> str:
+        """
+        Execute an AppleScript without blocking the event loop.
+
+        Each call gets its own osascript process, so several calls can be in
+        flight at once.
+
+        Args:
+            script: The AppleScript code to execute
+            timeout: Maximum execution time in seconds
+
+        Returns:
+            The stdout from the script execution
+
+        Raises:
+            AppleScriptError: If the script fails or times out
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing AppleScript (async):\n%s", script)
+
+        proc = await asyncio.create_subprocess_exec(
+            "osascript",
+            "-",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(script.encode("utf-8")), timeout
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.error("AppleScript timed out after %d seconds", timeout)
+            raise AppleScriptError(f"Script timed out after {timeout} seconds")
+
+        if proc.returncode != 0:
+            error_msg = (
+                stderr.decode("utf-8", errors="replace").strip()
+                or "Unknown AppleScript error"
+            )
+            logger.error("AppleScript failed: %s", error_msg)
+            raise AppleScriptError(error_msg)
+
+        output = stdout.decode("utf-8", errors="replace").strip()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("AppleScript result: %s", output[:500] if output else "(empty)")
+        return output
+
+    def stream(self, script: str, timeout: int = 30) -> Iterator[str]:
+        """
+        Execute an AppleScript and yield its output in chunks of whole lines.
+
+        The output is read from the osascript pipe and decoded piece by piece,
+        so callers can parse large row-based results without holding the raw
+        bytes, the decoded text and the parsed rows in memory at once. Every
+        chunk ends at a line boundary (the trailing linefeed is dropped).
+        Falls back to a single chunk from run() in in-process mode, where the
+        result is already in memory.
+
+        Args:
+            script: The AppleScript code to execute
+            timeout: Maximum execution time in seconds
+
+        Yields:
+            Consecutive pieces of the output, each made of complete lines
+
+        Raises:
+            AppleScriptError: If the script fails or times out
+        """
+        if self.in_process:
+            yield self.run(script, timeout=timeout)
+            return
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executing AppleScript (streamed):\n%s", script)
+
+        proc = subprocess.Popen(
+            ["osascript", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            # osascript reads the whole script before running it
+            proc.stdin.write(script.encode("utf-8"))
+            proc.stdin.close()
+
+            pending = bytearray()
+            errors = bytearray()
+            deadline = time.monotonic() + timeout
+            with selectors.DefaultSelector() as selector:
+                selector.register(proc.stdout, selectors.EVENT_READ)
+                selector.register(proc.stderr, selectors.EVENT_READ)
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    ready = selector.select(remaining) if remaining > 0 else []
+                    if not ready:
+                        logger.error("AppleScript timed out after %d seconds", timeout)
+                        raise AppleScriptError(f"Script timed out after {timeout} seconds")
+
+                    for key, _ in ready:
+                        data = os.read(key.fileobj.fileno(), 65536)
+                        if not data:
+                            selector.unregister(key.fileobj)
+                        elif key.fileobj is proc.stderr:
+                            errors.extend(data)
+                        else:
+                            pending.extend(data)
+                            # A linefeed byte never occurs inside a UTF-8 sequence
+                            cut = pending.rfind(b"\n")
+                            if cut >= 0:
+                                lines = pending[:cut]
+                                del pending[: cut + 1]
+                                if lines:
+                                    yield lines.decode("utf-8", errors="replace")
+
+            proc.wait()
+            if proc.returncode != 0:
+                error_msg = (
+                    errors.decode("utf-8", errors="replace").strip()
+                    or "Unknown AppleScript error"
+                )
+                logger.error("AppleScript failed: %s", error_msg)
+                raise AppleScriptError(error_msg)
+
+            if pending.strip():
+                yield pending.decode("utf-8", errors="replace").rstrip("\n")
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+
+    def _run_in_process(self, script: str) -> str:
+        """Run a script with NSAppleScript, reusing compiled identical scripts."""
+        try:
+            with self._lock:
+                output = runner.compiled(script).execute()
+        except runner.InProcessError as e:
+            logger.error("AppleScript failed: %s", e)
+            raise AppleScriptError(str(e)) from e
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("AppleScript result: %s", output[:500] if output else "(empty)")
+        return output
+
+    def run_compiled(
+        self, name: str, source: str, *args: str, timeout: int = 30
+    ) -> str:
+        """
+        Execute a script compiled once to a .scpt file, passing args as argv.
+
+        The source must read its parameters from the argv of an
+        `on run argv` handler. It is compiled with osacompile on first use,
+        so later calls skip AppleScript compilation and nothing is
+        interpolated into the source. The in-process executor runs the source
+        with `run script ... with parameters` instead.
+
+        Args:
+            name: Short name for the compiled file (e.g. "list_mailboxes")
+            source: AppleScript source with an `on run argv` handler
+            *args: String arguments passed to the run handler
+            timeout: Maximum execution time in seconds
+
+        Returns:
+            The stdout from the script execution
+
+        Raises:
+            AppleScriptError: If compiling or running the script fails
+        """
+        if self.in_process:
+            params = ", ".join(f'"{esc(arg)}"' for arg in args)
+            return self.run(
+                f'run script "{esc(source)}" with parameters {{{params}}}', timeout=timeout
+            )
+
+        return self.run_script_file(self._compile(name, source), list(args), timeout)
+
+    def _compile(self, name: str, source: str) -> str:
+        """Return the path of source compiled to a .scpt, compiling it if needed."""
+        digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+        path = self._compiled.get(digest)
+        if path is not None:
+            return path
+
+        with self._compile_lock:
+            path = os.path.join(COMPILED_DIR, f"{name}-{digest}.scpt")
+            if not os.path.exists(path):
+                os.makedirs(COMPILED_DIR, exist_ok=True)
+                # Compile next to the target and rename, so that concurrent
+                # servers never run a half-written file
+                tmp_path = os.path.join(COMPILED_DIR, f"{name}-{digest}-{os.getpid()}.scpt")
+                try:
+                    result = subprocess.run(
+                        ["osacompile", "-o", tmp_path],
+                        input=source.encode("utf-8"),
+                        capture_output=True,
+                        timeout=30,
+                    )
+                except subprocess.TimeoutExpired:
+                    raise AppleScriptError(f"Compiling {name} timed out")
+                if result.returncode != 0:
+                    error_msg = result.stderr.decode("utf-8", errors="replace").strip()
+                    logger.error("Compiling %s failed: %s", name, error_msg)
+                    raise AppleScriptError(error_msg or f"Could not compile {name}")
+                os.replace(tmp_path, path)
+                logger.info("Compiled %s to %s", name, path)
+            self._compiled[digest] = path
+        return path
+
     def run_script_file(
         self, script_path: str, args: Optional[list[str]] = None, timeout: int = 30
     ) -> str:
@@ -72,15 +329,54 @@ class AppleScriptExecutor:
             cmd.extend(args)
 
         try:
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=timeout
-            )
+            result = subprocess.run(cmd, capture_output=True, timeout=timeout)
 
             if result.returncode != 0:
-                error_msg = result.stderr.strip() or "Unknown AppleScript error"
+                error_msg = (
+                    result.stderr.decode("utf-8", errors="replace").strip()
+                    or "Unknown AppleScript error"
+                )
+                logger.error("AppleScript failed: %s", error_msg)
                 raise AppleScriptError(error_msg)
 
-            return result.stdout.strip()
+            return result.stdout.strip().decode("utf-8", errors="replace")
 
         except subprocess.TimeoutExpired:
             raise AppleScriptError(f"Script timed out after {timeout} seconds")
+
+
+_default_executor: Optional[AppleScriptExecutor] = None
+_default_lock = threading.Lock()
+
+
+# Execution mode of the shared executor, from the APPLE_MAIL_MCP_EXECUTOR
+# environment variable
+EXECUTOR_MODES = {
+    "subprocess": {},
+    "inprocess": {"in_process": True},
+}
+DEFAULT_EXECUTOR_MODE = "subprocess"
+
+
+def get_executor() -> AppleScriptExecutor:
+    """
+    Return the shared AppleScriptExecutor, creating it on first use.
+
+    By default every script runs in its own osascript process. Set
+    APPLE_MAIL_MCP_EXECUTOR to "inprocess" to compile and run scripts with
+    NSAppleScript instead (requires PyObjC), saving the process launch on
+    every call.
+    """
+    global _default_executor
+    if _default_executor is None:
+        with _default_lock:
+            if _default_executor is None:
+                mode = os.environ.get("APPLE_MAIL_MCP_EXECUTOR", DEFAULT_EXECUTOR_MODE)
+                options = EXECUTOR_MODES.get(mode.strip().lower())
+                if options is None:
+                    logger.warning(
+                        "Unknown APPLE_MAIL_MCP_EXECUTOR %r, using %s", mode, DEFAULT_EXECUTOR_MODE
+                    )
+                    options = EXECUTOR_MODES[DEFAULT_EXECUTOR_MODE]
+                _default_executor = AppleScriptExecutor(**options)
+    return _default_executor
@@ -0,0 +1,70 @@
+"""In-process AppleScript execution via NSAppleScript (optional, needs PyObjC)."""
+
+import functools
+import logging
+
+try:
+    from Foundation import NSAppleScript
+except ImportError:  # PyObjC not installed
+    NSAppleScript = None
+
+logger = logging.getLogger(__name__)
+
+# Compiled scripts kept around for identical sources (e.g. memoized templates)
+_COMPILED_CACHE_SIZE = 128
+
+
+class InProcessError(Exception):
+    """Raised when NSAppleScript fails to compile or run a script."""
+
+    pass
+
+
+def available() -> bool:
+    """Return True if PyObjC's NSAppleScript can be used."""
+    return NSAppleScript is not None
+
+
+def _error_message(error: dict | None) -> str:
+    if not error:
+        return "Unknown AppleScript error"
+    return str(error.get("NSAppleScriptErrorMessage") or error)
+
+
+class CompiledScript:
+    """An AppleScript compiled once and run in this process."""
+
+    def __init__(self, source: str):
+        """
+        Args:
+            source: AppleScript source code
+
+        Raises:
+            InProcessError: If PyObjC is missing or the script does not compile
+        """
+        if NSAppleScript is None:
+            raise InProcessError("PyObjC is not installed")
+
+        self._script = NSAppleScript.alloc().initWithSource_(source)
+        ok, error = self._script.compileAndReturnError_(None)
+        if not ok:
+            raise InProcessError(_error_message(error))
+
+    def execute(self) -> str:
+        """
+        Run the script and return its result as text.
+
+        Raises:
+            InProcessError: If the script raises an error
+        """
+        descriptor, error = self._script.executeAndReturnError_(None)
+        if descriptor is None:
+            raise InProcessError(_error_message(error))
+        return (descriptor.stringValue() or "").strip()
+
+
+@functools.lru_cache(maxsize=_COMPILED_CACHE_SIZE)
+def compiled(source: str) -> CompiledScript:
+    """Return a CompiledScript for source, compiling it on first use."""
+    logger.debug("Compiling AppleScript in-process (%d chars)", len(source))
+    return CompiledScript(source)
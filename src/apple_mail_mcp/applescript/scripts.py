@@ -1,60 +1,359 @@
 """AppleScript templates for Apple Mail operations."""
 
+import functools
+from datetime import datetime
+
 from .escape import esc, RECORD_SEP, UNIT_SEP, GROUP_SEP
 
+# Handler prepended to bulk scripts: resolves a message id by its index hint
+# (position from a recent listing, 0 if unknown) and otherwise against an id
+# column fetched on the first miss (a single Apple Event) instead of running a
+# whose-scan of the mailbox for every id. Positions are verified on use and a
+# whose lookup is only done if the column went stale (e.g. after a move).
+_ID_INDEX_HANDLER = '''
+script idIndex
+    property ids : missing value
+end script
+
+on messageById(mb, theId, hint)
+    tell application "Mail"
+        if hint > 0 then
+            try
+                set msg to message hint of mb
+                if id of msg is theId then return msg
+            end try
+        end if
+        if ids of idIndex is missing value then set ids of idIndex to id of messages of mb
+    end tell
+    set n to count of ids of idIndex
+    repeat with i from 1 to n
+        if item i of ids of idIndex is theId then
+            tell application "Mail"
+                set msg to message i of mb
+                if id of msg is theId then return msg
+            end tell
+            exit repeat
+        end if
+    end repeat
+    tell application "Mail" to return first message of mb whose id is theId
+end messageById
+'''
 
-class Scripts:
-    """Collection of AppleScript templates for Mail.app interaction."""
+# Conditions for every (unread_only, flagged_only) combination, as
+# (property, test) pairs such as ("read status", "is false")
+_FILTER = {
+    (False, False): (),
+    (True, False): (("read status", "is false"),),
+    (False, True): (("flagged status", "is true"),),
+    (True, True): (("read status", "is false"), ("flagged status", "is true")),
+}
+
+
+def _page_selection(
+    conditions: tuple[tuple[str, str], ...],
+    offset: int,
+    limit: int,
+    return_total: bool = True,
+    seen_ids: tuple[int, ...] | None = None,
+) -> str:
+    """AppleScript that sets totalCount and msgList (the requested page) for mb.
+
+    Without conditions the page is taken with a range specifier, so Mail only
+    resolves the messages on the page. A whose clause has to be evaluated over
+    the whole mailbox, so its matches are listed once and sliced (and counting
+    that list is free). When return_total is False an unfiltered mailbox is
+    not counted at all and totalCount is -1; the mailbox is only counted if
+    the page runs past its end.
+
+    Only the first (property, test) condition becomes a whose clause; compound
+    whose clauses are much slower in Mail. The matches' values of any further
+    properties are fetched with one Apple Event each and tested locally.
+
+    For "since" listings (seen_ids not None, first condition on sinceDate)
+    matches received at sinceDate whose id is in seen_ids are dropped, and
+    newestDate/newestIds are set to the newest date received over all kept
+    matches and the ids received at it (sinceDate and seen_ids if none is
+    newer).
+    """
+    if seen_ids is not None:
+        (prop, test), *rest = conditions
+        whose = f"whose {prop} {test}"
+        columns = "\n    ".join(
+            f"set refineCol{n} to {rest_prop} of (messages of mb {whose})"
+            for n, (rest_prop, _) in enumerate(rest, start=1)
+        )
+        tests = "".join(
+            f"(item k of refineCol{n}) {rest_test} and "
+            for n, (_, rest_test) in enumerate(rest, start=1)
+        )
+        seen = "{" + ", ".join(str(i) for i in seen_ids) + "}"
+        return f'''set matchList to (messages of mb {whose})
+    {columns}
+    set idCol to id of (messages of mb {whose})
+    set dateCol to date received of (messages of mb {whose})
+    set seenIds to {seen}
+    set newestDate to sinceDate
+    copy seenIds to newestIds
+    set keptList to {{}}
+    repeat with k from 1 to count of matchList
+        try
+            set msgId to item k of idCol
+            set msgDateValue to item k of dateCol
+            if {tests}not (msgDateValue = sinceDate and seenIds contains msgId) then
+                set end of keptList to item k of matchList
+                if msgDateValue > newestDate then
+                    set newestDate to msgDateValue
+                    set newestIds to {{msgId}}
+                else if msgDateValue = newestDate then
+                    set end of newestIds to msgId
+                end if
+            end if
+        end try
+    end repeat
+    set matchList to keptList
+    set totalCount to count of matchList
+    set startIdx to {offset} + 1
+    set endIdx to {offset} + {limit}
+    if endIdx > totalCount then set endIdx to totalCount
+    set msgList to {{}}
+    if startIdx <= endIdx then set msgList to items startIdx thru endIdx of matchList'''
+
+    if conditions:
+        (prop, test), *rest = conditions
+        whose = f"whose {prop} {test}"
+        selection = f"set matchList to (messages of mb {whose})"
+        if rest:
+            columns = "\n    ".join(
+                f"set refineCol{n} to {rest_prop} of (messages of mb {whose})"
+                for n, (rest_prop, _) in enumerate(rest, start=1)
+            )
+            tests = " and ".join(
+                f"(item k of refineCol{n}) {rest_test}"
+                for n, (_, rest_test) in enumerate(rest, start=1)
+            )
+            selection += f'''
+    {columns}
+    set keptList to {{}}
+    repeat with k from 1 to count of matchList
+        try
+            if {tests} then set end of keptList to item k of matchList
+        end try
+    end repeat
+    set matchList to keptList'''
 
-    @staticmethod
-    def list_accounts() -> str:
-        """List all mail accounts with their details."""
-        return f'''
+        return f'''{selection}
+    set totalCount to count of matchList
+    set startIdx to {offset} + 1
+    set endIdx to {offset} + {limit}
+    if endIdx > totalCount then set endIdx to totalCount
+    set msgList to {{}}
+    if startIdx <= endIdx then set msgList to items startIdx thru endIdx of matchList'''
+
+    if not return_total:
+        return f'''set totalCount to -1
+    set startIdx to {offset} + 1
+    set endIdx to {offset} + {limit}
+    try
+        set msgList to messages startIdx thru endIdx of mb
+    on error
+        -- The page runs past the end of the mailbox: clamp it
+        set mbCount to count of messages of mb
+        if endIdx > mbCount then set endIdx to mbCount
+        set msgList to {{}}
+        if startIdx <= endIdx then set msgList to messages startIdx thru endIdx of mb
+    end try'''
+
+    return f'''set totalCount to count of messages of mb
+    set startIdx to {offset} + 1
+    set endIdx to {offset} + {limit}
+    if endIdx > totalCount then set endIdx to totalCount
+    set msgList to {{}}
+    if startIdx <= endIdx then set msgList to messages startIdx thru endIdx of mb'''
+
+
+def _summary_rows(
+    conditions: tuple[tuple[str, str], ...],
+    offset: int,
+    limit: int,
+    return_total: bool = True,
+    seen_ids: tuple[int, ...] | None = None,
+) -> str:
+    """AppleScript that appends the TOTAL line and one summary row per message
+    of the page to outputItems.
+
+    An unfiltered page is a range specifier, so each field is fetched for the
+    whole page with one Apple Event (id of messages a thru b of mb, ...) and
+    the columns are zipped locally. Filtered pages are lists of references
+    and are read message by message.
+
+    For "since" listings (seen_ids not None, see _page_selection) a second
+    header line CURSOR:<date>|<ids> holds the newest date received over all
+    matches, not just the page, and the ids received at that date.
+    """
+    selection = _page_selection(conditions, offset, limit, return_total, seen_ids)
+    header = '''-- Output total count as first line
+    set end of outputItems to "TOTAL:" & totalCount & linefeed'''
+
+    if seen_ids is not None:
+        return f'''{selection}
+
+    {header}
+    set AppleScript's text item delimiters to ","
+    set end of outputItems to "CURSOR:" & (newestDate as «class isot» as string) & "|" & (newestIds as text) & linefeed
+    set AppleScript's text item delimiters to ""
+
+    repeat with msg in msgList
+        set msgId to id of msg
+        set msgSubject to subject of msg
+        set msgSender to sender of msg
+        set msgDate to date received of msg as string
+        set msgRead to read status of msg
+        set msgFlagged to flagged status of msg
+        set end of outputItems to (msgId as text) & RS & msgSubject & RS & msgSender & RS & msgDate & RS & msgRead & RS & msgFlagged & linefeed
+    end repeat'''
+
+    if conditions:
+        return f'''{selection}
+
+    {header}
+
+    repeat with msg in msgList
+        set msgId to id of msg
+        set msgSubject to subject of msg
+        set msgSender to sender of msg
+        set msgDate to date received of msg as string
+        set msgRead to read status of msg
+        set msgFlagged to flagged status of msg
+        set end of outputItems to (msgId as text) & RS & msgSubject & RS & msgSender & RS & msgDate & RS & msgRead & RS & msgFlagged & linefeed
+    end repeat'''
+
+    return f'''{selection}
+
+    {header}
+
+    if (count of msgList) > 0 then
+        set idCol to id of messages startIdx thru endIdx of mb
+        set subjectCol to subject of messages startIdx thru endIdx of mb
+        set senderCol to sender of messages startIdx thru endIdx of mb
+        set dateCol to date received of messages startIdx thru endIdx of mb
+        set readCol to read status of messages startIdx thru endIdx of mb
+        set flaggedCol to flagged status of messages startIdx thru endIdx of mb
+
+        repeat with k from 1 to count of idCol
+            set end of outputItems to ((item k of idCol) as text) & RS & (item k of subjectCol) & RS & (item k of senderCol) & RS & ((item k of dateCol) as string) & RS & (item k of readCol) & RS & (item k of flaggedCol) & linefeed
+        end repeat
+    end if'''
+
+
+def _date_setup(var: str, when: datetime) -> str:
+    """AppleScript that sets var to a date built from components.
+
+    Avoids date "..." literals, whose parsing depends on the user's locale.
+    The day is reset first so that changing the month cannot overflow.
+    """
+    seconds = when.hour * 3600 + when.minute * 60 + when.second
+    return f'''set {var} to current date
+    set day of {var} to 1
+    set year of {var} to {when.year}
+    set month of {var} to {when.month}
+    set day of {var} to {when.day}
+    set time of {var} to {seconds}'''
+
+
+def _content_fetch(headers_only: bool, content_limit: int | None) -> str:
+    """AppleScript that sets msgContent to the body of msg (see read_messages)."""
+    if headers_only:
+        return 'set msgContent to ""'
+    if content_limit is not None and content_limit > 0:
+        return f'''set msgContent to content of msg
+            if (count of msgContent) > {content_limit} then
+                set msgContent to (text 1 thru {content_limit} of msgContent) & "..."
+            end if'''
+    return "set msgContent to content of msg"
+
+
+def _id_lists(message_ids: list[int], index_hints: list[int | None] | None) -> str:
+    """AppleScript that sets idList and hintList (0 where unknown) for
+    messageById."""
+    ids_str = ", ".join(map(str, message_ids))
+    if index_hints is None:
+        hints_str = ", ".join("0" for _ in message_ids)
+    else:
+        hints_str = ", ".join(str(hint or 0) for hint in index_hints)
+    return f'''set idList to {{{ids_str}}}
+    set hintList to {{{hints_str}}}'''
+
+
+def _message_lookup(mb: str, message_id: int, index_hint: int | None) -> str:
+    """AppleScript that sets msg to the message with message_id in mailbox mb.
+
+    With an index hint (the message's position from a recent listing) the
+    message is addressed directly and its id verified; the whose-scan of the
+    mailbox only runs when there is no hint or the hint went stale.
+    """
+    if index_hint is None:
+        return f"set msg to first message of {mb} whose id is {message_id}"
+    return f'''set msg to missing value
+    try
+        set msg to message {index_hint} of {mb}
+        if id of msg is not {message_id} then set msg to missing value
+    end try
+    if msg is missing value then set msg to first message of {mb} whose id is {message_id}'''
+
+# Parameterless scripts are rendered once at import time
+_LIST_ACCOUNTS_SCRIPT = '''
 tell application "Mail"
-    set output to ""
+    set RS to character id 30
+    set outputItems to {}
     repeat with acc in accounts
         set accName to name of acc
         set accEmail to email addresses of acc as string
         set accEnabled to enabled of acc
         set accType to account type of acc as string
-        set output to output & accName & (ASCII character 30) & accEmail & (ASCII character 30) & accEnabled & (ASCII character 30) & accType & linefeed
+        set end of outputItems to accName & RS & accEmail & RS & accEnabled & RS & accType & linefeed
     end repeat
-    return output
+    set AppleScript's text item delimiters to ""
+    return outputItems as text
 end tell
 '''
 
-    @staticmethod
-    def list_mailboxes(account_name: str, include_nested: bool = True) -> str:
-        """List mailboxes for a specific account."""
-        account_name = esc(account_name)
-        if include_nested:
-            return f'''
+
+def _mailbox_listing(account_ref: str, include_nested: bool, per_mailbox: str = "") -> str:
+    """Mailbox listing script for account_ref (e.g. 'account "Work"').
+
+    per_mailbox (nested listings only) is run after each mailbox row, with the
+    mailbox in currentMb and its message count in msgCount.
+    """
+    if include_nested:
+        return f'''
 tell application "Mail"
-    set output to ""
-    set acc to account "{account_name}"
+    set RS to character id 30
+    set outputItems to {{}}
 
     -- Use a queue-based approach for iterative traversal
     set mbQueue to {{}}
     set prefixQueue to {{}}
 
     -- Initialize with top-level mailboxes
-    repeat with mb in mailboxes of acc
+    repeat with mb in mailboxes of {account_ref}
         set end of mbQueue to mb
         set end of prefixQueue to ""
     end repeat
 
-    -- Process queue
-    repeat while (count of mbQueue) > 0
-        set currentMb to item 1 of mbQueue
-        set currentPrefix to item 1 of prefixQueue
-
-        -- Remove first items from queues
-        if (count of mbQueue) > 1 then
-            set mbQueue to items 2 thru -1 of mbQueue
-            set prefixQueue to items 2 thru -1 of prefixQueue
-        else
-            set mbQueue to {{}}
-            set prefixQueue to {{}}
+    -- Process queue with a moving head index; popping with "items 2 thru -1"
+    -- would copy the remaining queue on every step
+    set qHead to 1
+    repeat while qHead <= (count of mbQueue)
+        set currentMb to item qHead of mbQueue
+        set currentPrefix to item qHead of prefixQueue
+        set qHead to qHead + 1
+
+        -- Drop the consumed prefix now and then so the queue does not keep
+        -- every visited mailbox alive for the whole traversal
+        if qHead > 512 and qHead <= (count of mbQueue) then
+            set mbQueue to items qHead thru -1 of mbQueue
+            set prefixQueue to items qHead thru -1 of prefixQueue
+            set qHead to 1
         end if
 
         -- Get mailbox info
@@ -62,7 +361,8 @@ tell application "Mail"
         set fullPath to currentPrefix & mbName
         set msgCount to count of messages of currentMb
         set unreadCount to unread count of currentMb
-        set output to output & fullPath & (ASCII character 30) & msgCount & (ASCII character 30) & unreadCount & linefeed
+        set end of outputItems to fullPath & RS & msgCount & RS & unreadCount & linefeed
+        {per_mailbox}
 
         -- Add child mailboxes to queue
         try
@@ -73,26 +373,80 @@ tell application "Mail"
         end try
     end repeat
 
-    return output
+    set AppleScript's text item delimiters to ""
+    return outputItems as text
 end tell
 '''
-        else:
-            return f'''
+    else:
+        return f'''
 tell application "Mail"
-    set output to ""
-    set acc to account "{account_name}"
+    set RS to character id 30
+    set outputItems to {{}}
 
-    repeat with mb in mailboxes of acc
+    repeat with mb in mailboxes of {account_ref}
         set mbName to name of mb
         set msgCount to count of messages of mb
         set unreadCount to unread count of mb
-        set output to output & mbName & (ASCII character 30) & msgCount & (ASCII character 30) & unreadCount & linefeed
+        set end of outputItems to mbName & RS & msgCount & RS & unreadCount & linefeed
     end repeat
 
-    return output
+    set AppleScript's text item delimiters to ""
+    return outputItems as text
 end tell
 '''
 
+
+class Scripts:
+    """Collection of AppleScript templates for Mail.app interaction."""
+
+    @staticmethod
+    def list_accounts() -> str:
+        """List all mail accounts with their details."""
+        return _LIST_ACCOUNTS_SCRIPT
+
+    @staticmethod
+    def list_mailboxes(account_name: str, include_nested: bool = True) -> str:
+        """List mailboxes for a specific account."""
+        return _mailbox_listing(f'account "{esc(account_name)}"', include_nested)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def list_mailboxes_argv(include_nested: bool = True) -> str:
+        """list_mailboxes taking the account name as its first argument, for
+        AppleScriptExecutor.run_compiled."""
+        return f'''
+on run argv
+    set accountName to item 1 of argv
+{_mailbox_listing("account accountName", include_nested)}
+end run
+'''
+
+    @staticmethod
+    def account_snapshot(account_name: str, messages_per_mailbox: int = 10) -> str:
+        """List an account's mailboxes (nested) with the first messages of each.
+
+        Each mailbox is a block terminated by GROUP_SEP: the list_mailboxes row,
+        then up to messages_per_mailbox summary rows as in list_messages.
+        """
+        per_mailbox = ""
+        if messages_per_mailbox > 0:
+            per_mailbox = f'''if msgCount > 0 then
+            set endIdx to {messages_per_mailbox}
+            if endIdx > msgCount then set endIdx to msgCount
+            set idCol to id of messages 1 thru endIdx of currentMb
+            set subjectCol to subject of messages 1 thru endIdx of currentMb
+            set senderCol to sender of messages 1 thru endIdx of currentMb
+            set dateCol to date received of messages 1 thru endIdx of currentMb
+            set readCol to read status of messages 1 thru endIdx of currentMb
+            set flaggedCol to flagged status of messages 1 thru endIdx of currentMb
+            repeat with k from 1 to count of idCol
+                set end of outputItems to ((item k of idCol) as text) & RS & (item k of subjectCol) & RS & (item k of senderCol) & RS & ((item k of dateCol) as string) & RS & (item k of readCol) & RS & (item k of flaggedCol) & linefeed
+            end repeat
+        end if'''
+        per_mailbox += "\n        set end of outputItems to character id 29"
+
+        return _mailbox_listing(f'account "{esc(account_name)}"', True, per_mailbox)
+
     @staticmethod
     def list_messages(
         account_name: str,
@@ -103,46 +457,61 @@ end tell
         flagged_only: bool = False,
         include_content: bool = False,
         content_limit: int | None = None,
+        return_total: bool = True,
+        since: str | None = None,
     ) -> str:
-        """List messages in a mailbox with optional filtering and content."""
+        """List messages in a mailbox with optional filtering and content.
+
+        With return_total=False an unfiltered listing skips counting the
+        mailbox and reports TOTAL:-1.
+
+        since (summary listings only) is an ISO 8601 date, optionally
+        followed by "|" and the comma-separated ids already listed at that
+        date (the cursor of a previous call). Messages received at or after
+        the date are listed, minus those ids, and a CURSOR:<cursor> header
+        follows the TOTAL line with the value to pass as since on the next
+        call.
+        """
         account_name = esc(account_name)
         mailbox_path = esc(mailbox_path)
 
-        filter_condition = ""
-        if unread_only and flagged_only:
-            filter_condition = "whose read status is false and flagged status is true"
-        elif unread_only:
-            filter_condition = "whose read status is false"
-        elif flagged_only:
-            filter_condition = "whose flagged status is true"
+        conditions = _FILTER[(bool(unread_only), bool(flagged_only))]
+
+        since_setup = ""
+        seen_ids = None
+        if since is not None and not include_content:
+            date_text, _, ids_text = since.partition("|")
+            when = datetime.fromisoformat(date_text)
+            if when.tzinfo is not None:
+                # Mail dates are local time
+                when = when.astimezone().replace(tzinfo=None)
+            seen_ids = tuple(int(i) for i in ids_text.split(",") if i)
+            since_setup = _date_setup("sinceDate", when) + "\n    "
+            # New mail is usually the smallest set: make it the whose clause
+            conditions = (("date received", ">= sinceDate"), *conditions)
 
         if include_content:
             # Include full message data with content
             content_truncation = ""
-            if content_limit is not None:
+            if content_limit is not None and content_limit > 0:
                 content_truncation = f'''
                 if (count of msgContent) > {content_limit} then
-                    set msgContent to text 1 thru {content_limit} of msgContent
+                    set msgContent to (text 1 thru {content_limit} of msgContent) & "..."
                 end if'''
 
             return f'''
 tell application "Mail"
-    set output to ""
-    set acc to account "{account_name}"
-    set mb to mailbox "{mailbox_path}" of acc
+    set US to character id 31
+    set GS to character id 29
+    set outputItems to {{}}
+    set mb to mailbox "{mailbox_path}" of account "{account_name}"
 
-    set msgList to (messages of mb {filter_condition})
-    set totalCount to count of msgList
-    set startIdx to {offset} + 1
-    set endIdx to {offset} + {limit}
-    if endIdx > totalCount then set endIdx to totalCount
-    if startIdx > totalCount then set startIdx to totalCount + 1
+    {_page_selection(conditions, offset, limit, return_total)}
 
     -- Output total count as first line
-    set output to "TOTAL:" & totalCount & linefeed
+    set end of outputItems to "TOTAL:" & totalCount & linefeed
 
-    repeat with i from startIdx to endIdx
-        set msg to item i of msgList
+    repeat with msg in msgList
         set msgId to id of msg
         set msgSubject to subject of msg
         set msgSender to sender of msg
@@ -152,68 +521,57 @@ tell application "Mail"
         set msgContent to content of msg
         {content_truncation}
 
-        -- Get recipients
-        set toList to ""
-        repeat with recip in to recipients of msg
-            set toList to toList & address of recip & ", "
-        end repeat
-        if toList is not "" then set toList to text 1 thru -3 of toList
-
-        set ccList to ""
-        repeat with recip in cc recipients of msg
-            set ccList to ccList & address of recip & ", "
-        end repeat
-        if ccList is not "" then set ccList to text 1 thru -3 of ccList
+        -- Get recipients: one Apple Event per list, joined in a single pass
+        set oldTID to AppleScript's text item delimiters
+        set AppleScript's text item delimiters to ", "
+        set toList to (address of every to recipient of msg) as string
+        set ccList to (address of every cc recipient of msg) as string
+        set AppleScript's text item delimiters to oldTID
 
-        set output to output & msgId & (ASCII character 31) & msgSubject & (ASCII character 31) & msgSender & (ASCII character 31) & toList & (ASCII character 31) & ccList & (ASCII character 31) & msgDate & (ASCII character 31) & msgRead & (ASCII character 31) & msgFlagged & (ASCII character 31) & msgContent & (ASCII character 29)
+        set end of outputItems to (msgId as text) & US & msgSubject & US & msgSender & US & toList & US & ccList & US & msgDate & US & msgRead & US & msgFlagged & US & (count of msgContent) & ":" & msgContent & GS
     end repeat
 
-    return output
+    set AppleScript's text item delimiters to ""
+    return outputItems as text
 end tell
 '''
         else:
             # Summary only (no content)
             return f'''
 tell application "Mail"
-    set output to ""
-    set acc to account "{account_name}"
-    set mb to mailbox "{mailbox_path}" of acc
+    set RS to character id 30
+    set outputItems to {{}}
+    set mb to mailbox "{mailbox_path}" of account "{account_name}"
 
-    set msgList to (messages of mb {filter_condition})
-    set totalCount to count of msgList
-    set startIdx to {offset} + 1
-    set endIdx to {offset} + {limit}
-    if endIdx > totalCount then set endIdx to totalCount
-    if startIdx > totalCount then set startIdx to totalCount + 1
+    {since_setup}{_summary_rows(conditions, offset, limit, return_total, seen_ids)}
 
-    -- Output total count as first line
-    set output to "TOTAL:" & totalCount & linefeed
-
-    repeat with i from startIdx to endIdx
-        set msg to item i of msgList
-        set msgId to id of msg
-        set msgSubject to subject of msg
-        set msgSender to sender of msg
-        set msgDate to date received of msg as string
-        set msgRead to read status of msg
-        set msgFlagged to flagged status of msg
-        set output to output & msgId & (ASCII character 30) & msgSubject & (ASCII character 30) & msgSender & (ASCII character 30) & msgDate & (ASCII character 30) & msgRead & (ASCII character 30) & msgFlagged & linefeed
-    end repeat
-
-    return output
+    set AppleScript's text item delimiters to ""
+    return outputItems as text
 end tell
 '''
 
     @staticmethod
-    def read_message(account_name: str, mailbox_path: str, message_id: int) -> str:
-        """Read full message content by ID."""
+    def read_message(
+        account_name: str,
+        mailbox_path: str,
+        message_id: int,
+        index_hint: int | None = None,
+        headers_only: bool = False,
+        content_limit: int | None = None,
+    ) -> str:
+        """Read full message content by ID.
+
+        index_hint is the message's position in the mailbox, if known; it is
+        verified before use. headers_only and content_limit are as in
+        read_messages.
+        """
         account_name = esc(account_name)
         mailbox_path = esc(mailbox_path)
         return f'''
 tell application "Mail"
-    set acc to account "{account_name}"
-    set mb to mailbox "{mailbox_path}" of acc
-    set msg to first message of mb whose id is {message_id}
+    set US to character id 31
+    set mb to mailbox "{mailbox_path}" of account "{account_name}"
+    {_message_lookup("mb", message_id, index_hint)}
 
     set msgId to id of msg
     set msgSubject to subject of msg
@@ -221,22 +579,16 @@ tell application "Mail"
     set msgDate to date received of msg as string
     set msgRead to read status of msg
     set msgFlagged to flagged status of msg
-    set msgContent to content of msg
+    {_content_fetch(headers_only, content_limit)}
 
-    -- Get recipients
-    set toList to ""
-    repeat with recip in to recipients of msg
-        set toList to toList & address of recip & ", "
-    end repeat
-    if toList is not "" then set toList to text 1 thru -3 of toList
-
-    set ccList to ""
-    repeat with recip in cc recipients of msg
-        set ccList to ccList & address of recip & ", "
-    end repeat
-    if ccList is not "" then set ccList to text 1 thru -3 of ccList
+    -- Get recipients: one Apple Event per list, joined in a single pass
+    set oldTID to AppleScript's text item delimiters
+    set AppleScript's text item delimiters to ", "
+    set toList to (address of every to recipient of msg) as string
+    set ccList to (address of every cc recipient of msg) as string
+    set AppleScript's text item delimiters to oldTID
 
-    return msgId & (ASCII character 31) & msgSubject & (ASCII character 31) & msgSender & (ASCII character 31) & toList & (ASCII character 31) & ccList & (ASCII character 31) & msgDate & (ASCII character 31) & msgRead & (ASCII character 31) & msgFlagged & (ASCII character 31) & msgContent
+    return (msgId as text) & US & msgSubject & US & msgSender & US & toList & US & ccList & US & msgDate & US & msgRead & US & msgFlagged & US & (count of msgContent) & ":" & msgContent
 end tell
 '''
 
@@ -246,6 +598,8 @@ end tell
         mailbox_path: str,
         message_id: int,
         destination_mailbox: str,
+        resolve_new_id: bool = True,
+        index_hint: int | None = None,
     ) -> str:
         """Move a message to another mailbox.
 
@@ -254,17 +608,33 @@ end tell
             mailbox_path: Source mailbox path
             message_id: ID of message to move
             destination_mailbox: Destination mailbox path
+            resolve_new_id: Look up the message's new ID in the destination.
+                This is a whose-scan of the destination mailbox; when False
+                only the move itself is performed.
+            index_hint: Position of the message in the source mailbox, if
+                known; verified before use
         """
         account_name = esc(account_name)
         mailbox_path = esc(mailbox_path)
         destination_mailbox = esc(destination_mailbox)
 
+        if not resolve_new_id:
+            return f'''
+tell application "Mail"
+    set srcMb to mailbox "{mailbox_path}" of account "{account_name}"
+    set destMb to mailbox "{destination_mailbox}" of account "{account_name}"
+    {_message_lookup("srcMb", message_id, index_hint)}
+    move msg to destMb
+    return "moved"
+end tell
+'''
+
         return f'''
 tell application "Mail"
-    set acc to account "{account_name}"
-    set srcMb to mailbox "{mailbox_path}" of acc
-    set destMb to mailbox "{destination_mailbox}" of acc
-    set msg to first message of srcMb whose id is {message_id}
+    set RS to character id 30
+    set srcMb to mailbox "{mailbox_path}" of account "{account_name}"
+    set destMb to mailbox "{destination_mailbox}" of account "{account_name}"
+    {_message_lookup("srcMb", message_id, index_hint)}
 
     -- Store message id (RFC 822 Message-ID) for reliable lookup after move
     set msgMessageId to message id of msg
@@ -273,13 +643,17 @@ tell application "Mail"
     set movedMsg to first message of destMb whose message id is msgMessageId
     set newId to id of movedMsg
 
-    return "moved" & (ASCII character 30) & newId
+    return "moved" & RS & newId
 end tell
 '''
 
     @staticmethod
     def set_read_status(
-        account_name: str, mailbox_path: str, message_id: int, read: bool
+        account_name: str,
+        mailbox_path: str,
+        message_id: int,
+        read: bool,
+        index_hint: int | None = None,
     ) -> str:
         """Set the read status of a message."""
         account_name = esc(account_name)
@@ -287,9 +661,8 @@ end tell
         read_val = "true" if read else "false"
         return f'''
 tell application "Mail"
-    set acc to account "{account_name}"
-    set mb to mailbox "{mailbox_path}" of acc
-    set msg to first message of mb whose id is {message_id}
+    set mb to mailbox "{mailbox_path}" of account "{account_name}"
+    {_message_lookup("mb", message_id, index_hint)}
     set read status of msg to {read_val}
     return "done"
 end tell
@@ -297,7 +670,11 @@ end tell
 
     @staticmethod
     def set_flagged_status(
-        account_name: str, mailbox_path: str, message_id: int, flagged: bool
+        account_name: str,
+        mailbox_path: str,
+        message_id: int,
+        flagged: bool,
+        index_hint: int | None = None,
     ) -> str:
         """Set the flagged status of a message."""
         account_name = esc(account_name)
@@ -305,58 +682,98 @@ end tell
         flagged_val = "true" if flagged else "false"
         return f'''
 tell application "Mail"
-    set acc to account "{account_name}"
-    set mb to mailbox "{mailbox_path}" of acc
-    set msg to first message of mb whose id is {message_id}
+    set mb to mailbox "{mailbox_path}" of account "{account_name}"
+    {_message_lookup("mb", message_id, index_hint)}
     set flagged status of msg to {flagged_val}
     return "done"
 end tell
 '''
 
     @staticmethod
-    def read_messages(account_name: str, mailbox_path: str, message_ids: list[int]) -> str:
-        """Read multiple messages by their IDs in a single call."""
+    def set_read_and_flagged_status(
+        account_name: str,
+        mailbox_path: str,
+        message_id: int,
+        read: bool,
+        flagged: bool,
+        index_hint: int | None = None,
+    ) -> str:
+        """Set the read and flagged status of a message in one pass."""
         account_name = esc(account_name)
         mailbox_path = esc(mailbox_path)
-        ids_str = ", ".join(str(mid) for mid in message_ids)
+        read_val = "true" if read else "false"
+        flagged_val = "true" if flagged else "false"
         return f'''
 tell application "Mail"
-    set acc to account "{account_name}"
-    set mb to mailbox "{mailbox_path}" of acc
-    set idList to {{{ids_str}}}
-    set output to ""
+    set mb to mailbox "{mailbox_path}" of account "{account_name}"
+    {_message_lookup("mb", message_id, index_hint)}
+    set read status of msg to {read_val}
+    set flagged status of msg to {flagged_val}
+    return "done"
+end tell
+'''
+
+    @staticmethod
+    def read_messages(
+        account_name: str,
+        mailbox_path: str,
+        message_ids: list[int],
+        headers_only: bool = False,
+        content_limit: int | None = None,
+        index_hints: list[int | None] | None = None,
+    ) -> str:
+        """Read multiple messages by their IDs in a single call.
 
-    repeat with msgId in idList
+        Args:
+            account_name: Name of the mail account
+            mailbox_path: Mailbox containing the messages
+            message_ids: IDs of the messages to read
+            headers_only: Skip the body entirely; the content field is empty.
+                Avoids downloading bodies from IMAP servers.
+            content_limit: Truncate each body in AppleScript; a cut body ends
+                with "..." after the first content_limit characters.
+            index_hints: Mailbox position of each message, if known (see
+                _ID_INDEX_HANDLER)
+        """
+        account_name = esc(account_name)
+        mailbox_path = esc(mailbox_path)
+
+        content_fetch = _content_fetch(headers_only, content_limit)
+        return _ID_INDEX_HANDLER + f'''
+tell application "Mail"
+    set US to character id 31
+    set GS to character id 29
+    set mb to mailbox "{mailbox_path}" of account "{account_name}"
+    {_id_lists(message_ids, index_hints)}
+    set outputItems to {{}}
+
+    repeat with k from 1 to count of idList
+        set msgId to item k of idList
         try
-            set msg to first message of mb whose id is msgId
+            set msg to my messageById(mb, msgId, item k of hintList)
 
             set msgSubject to subject of msg
             set msgSender to sender of msg
             set msgDate to date received of msg as string
             set msgRead to read status of msg
             set msgFlagged to flagged status of msg
-            set msgContent to content of msg
+            {content_fetch}
 
-            -- Get recipients
-            set toList to ""
-            repeat with recip in to recipients of msg
-                set toList to toList & address of recip & ", "
-            end repeat
-            if toList is not "" then set toList to text 1 thru -3 of toList
-
-            set ccList to ""
-            repeat with recip in cc recipients of msg
-                set ccList to ccList & address of recip & ", "
-            end repeat
-            if ccList is not "" then set ccList to text 1 thru -3 of ccList
+            -- Get recipients: one Apple Event per list, joined in a single pass
+            set oldTID to AppleScript's text item delimiters
+            set AppleScript's text item delimiters to ", "
+            set toList to (address of every to recipient of msg) as string
+            set ccList to (address of every cc recipient of msg) as string
+            set AppleScript's text item delimiters to oldTID
 
-            set output to output & msgId & (ASCII character 31) & msgSubject & (ASCII character 31) & msgSender & (ASCII character 31) & toList & (ASCII character 31) & ccList & (ASCII character 31) & msgDate & (ASCII character 31) & msgRead & (ASCII character 31) & msgFlagged & (ASCII character 31) & msgContent & (ASCII character 29)
+            set end of outputItems to (msgId as text) & US & msgSubject & US & msgSender & US & toList & US & ccList & US & msgDate & US & msgRead & US & msgFlagged & US & (count of msgContent) & ":" & msgContent & GS
         on error errMsg
-            set output to output & msgId & (ASCII character 31) & "ERROR" & (ASCII character 31) & errMsg & (ASCII character 29)
+            set end of outputItems to (msgId as text) & US & "ERROR" & US & errMsg & GS
         end try
     end repeat
 
-    return output
+    set AppleScript's text item delimiters to ""
+    return outputItems as text
 end tell
 '''
 
@@ -368,51 +785,39 @@ end tell
         subject_contains: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        return_total: bool = True,
+        body_contains: str | None = None,
     ) -> str:
-        """Search messages by sender and/or subject."""
+        """Search messages by sender, subject and/or body.
+
+        With return_total=False and no search terms the mailbox is not
+        counted and TOTAL:-1 is reported. A body filter makes Mail load the
+        content of every message; prefer the local index for body search.
+        """
         account_name = esc(account_name)
         mailbox_path = esc(mailbox_path)
 
-        # Build filter conditions - escape search terms for AppleScript
+        # Build filter conditions - escape search terms for AppleScript.
+        # The first one becomes the whose clause; body last, since reading
+        # content is by far the most expensive
         conditions = []
         if sender_contains:
-            conditions.append(f'sender contains "{esc(sender_contains)}"')
+            conditions.append(("sender", f'contains "{esc(sender_contains)}"'))
         if subject_contains:
-            conditions.append(f'subject contains "{esc(subject_contains)}"')
-
-        if conditions:
-            filter_clause = "whose " + " and ".join(conditions)
-        else:
-            filter_clause = ""
+            conditions.append(("subject", f'contains "{esc(subject_contains)}"'))
+        if body_contains:
+            conditions.append(("content", f'contains "{esc(body_contains)}"'))
 
         return f'''
 tell application "Mail"
-    set output to ""
-    set acc to account "{account_name}"
-    set mb to mailbox "{mailbox_path}" of acc
+    set RS to character id 30
+    set outputItems to {{}}
+    set mb to mailbox "{mailbox_path}" of account "{account_name}"
 
-    set msgList to (messages of mb {filter_clause})
-    set totalCount to count of msgList
-    set startIdx to {offset} + 1
-    set endIdx to {offset} + {limit}
-    if endIdx > totalCount then set endIdx to totalCount
-    if startIdx > totalCount then set startIdx to totalCount + 1
+    {_summary_rows(tuple(conditions), offset, limit, return_total)}
 
-    -- Output total count as first line
-    set output to "TOTAL:" & totalCount & linefeed
-
-    repeat with i from startIdx to endIdx
-        set msg to item i of msgList
-        set msgId to id of msg
-        set msgSubject to subject of msg
-        set msgSender to sender of msg
-        set msgDate to date received of msg as string
-        set msgRead to read status of msg
-        set msgFlagged to flagged status of msg
-        set output to output & msgId & (ASCII character 30) & msgSubject & (ASCII character 30) & msgSender & (ASCII character 30) & msgDate & (ASCII character 30) & msgRead & (ASCII character 30) & msgFlagged & linefeed
-    end repeat
-
-    return output
+    set AppleScript's text item delimiters to ""
+    return outputItems as text
 end tell
 '''
 
@@ -422,73 +827,134 @@ end tell
         mailbox_path: str,
         message_ids: list[int],
         destination_mailbox: str,
+        resolve_new_ids: bool = True,
+        index_hints: list[int | None] | None = None,
     ) -> str:
-        """Move multiple messages to another mailbox."""
+        """Move multiple messages to another mailbox.
+
+        All resolvable messages are moved with a single move command. When
+        resolve_new_ids is False the per-message lookup in the destination
+        mailbox is skipped and the new ID field of each result row is empty.
+        index_hints are the messages' positions in the source mailbox, if
+        known.
+        """
         account_name = esc(account_name)
         mailbox_path = esc(mailbox_path)
         destination_mailbox = esc(destination_mailbox)
-        ids_str = ", ".join(str(mid) for mid in message_ids)
 
-        return f'''
-tell application "Mail"
-    set acc to account "{account_name}"
-    set srcMb to mailbox "{mailbox_path}" of acc
-    set destMb to mailbox "{destination_mailbox}" of acc
-    set idList to {{{ids_str}}}
-    set output to ""
-
-    repeat with msgId in idList
+        if resolve_new_ids:
+            # RFC 822 Message-IDs survive the move, so they are collected
+            # beforehand and used to find each message in the destination
+            collect_block = '''
+            set end of messageIds to message id of msg'''
+            report_block = '''
         try
-            set msg to first message of srcMb whose id is msgId
-
-            -- Store message id (RFC 822 Message-ID) for reliable lookup after move
-            set msgMessageId to message id of msg
+            set movedMsg to first message of destMb whose message id is (item i of messageIds)
+            set end of outputItems to (movedId as text) & RS & (id of movedMsg) & RS & "success" & linefeed
+        on error errMsg
+            set end of outputItems to (movedId as text) & RS & movedId & RS & "error:" & errMsg & linefeed
+        end try'''
+        else:
+            collect_block = ""
+            report_block = '''
+        set end of outputItems to (movedId as text) & RS & "" & RS & "success" & linefeed'''
 
-            move msg to destMb
-            set movedMsg to first message of destMb whose message id is msgMessageId
-            set newId to id of movedMsg
+        return _ID_INDEX_HANDLER + f'''
+tell application "Mail"
+    set RS to character id 30
+    set srcMb to mailbox "{mailbox_path}" of account "{account_name}"
+    set destMb to mailbox "{destination_mailbox}" of account "{account_name}"
+    {_id_lists(message_ids, index_hints)}
+    set outputItems to {{}}
+
+    -- Resolve every message first, then move them all with one Apple Event
+    set movedMsgs to {{}}
+    set movedIds to {{}}
+    set messageIds to {{}}
+    repeat with k from 1 to count of idList
+        set msgId to item k of idList
+        try
+            set msg to my messageById(srcMb, msgId, item k of hintList){collect_block}
+            set end of movedMsgs to msg
+            set end of movedIds to msgId
+        on error errMsg
+            set end of outputItems to (msgId as text) & RS & msgId & RS & "error:" & errMsg & linefeed
+        end try
+    end repeat
 
-            set output to output & msgId & (ASCII character 30) & newId & (ASCII character 30) & "success" & linefeed
+    if (count of movedMsgs) > 0 then
+        try
+            move movedMsgs to destMb
         on error errMsg
-            set output to output & msgId & (ASCII character 30) & msgId & (ASCII character 30) & "error:" & errMsg & linefeed
+            repeat with movedId in movedIds
+                set end of outputItems to (movedId as text) & RS & movedId & RS & "error:" & errMsg & linefeed
+            end repeat
+            set movedIds to {{}}
         end try
+    end if
+
+    repeat with i from 1 to count of movedIds
+        set movedId to item i of movedIds{report_block}
     end repeat
 
-    return output
+    set AppleScript's text item delimiters to ""
+    return outputItems as text
 end tell
 '''
 
     @staticmethod
-    def bulk_set_read_status(
+    def bulk_set_flags(
         account_name: str,
         mailbox_path: str,
         message_ids: list[int],
-        read: bool,
+        read: bool | None = None,
+        flagged: bool | None = None,
+        index_hints: list[int | None] | None = None,
     ) -> str:
-        """Set read status for multiple messages."""
+        """Set read and/or flagged status for multiple messages in one pass.
+
+        A status left as None is not touched. Each message is resolved once
+        for both updates, using its position from index_hints when known.
+        """
         account_name = esc(account_name)
         mailbox_path = esc(mailbox_path)
-        ids_str = ", ".join(str(mid) for mid in message_ids)
-        read_val = "true" if read else "false"
-        return f'''
+
+        updates = []
+        if read is not None:
+            updates.append(f"set read status of msg to {'true' if read else 'false'}")
+        if flagged is not None:
+            updates.append(f"set flagged status of msg to {'true' if flagged else 'false'}")
+        update_block = "\n            ".join(updates)
+
+        return _ID_INDEX_HANDLER + f'''
 tell application "Mail"
-    set acc to account "{account_name}"
-    set mb to mailbox "{mailbox_path}" of acc
-    set idList to {{{ids_str}}}
+    set mb to mailbox "{mailbox_path}" of account "{account_name}"
+    {_id_lists(message_ids, index_hints)}
     set successCount to 0
 
-    repeat with msgId in idList
+    repeat with k from 1 to count of idList
+        set msgId to item k of idList
         try
-            set msg to first message of mb whose id is msgId
-            set read status of msg to {read_val}
+            set msg to my messageById(mb, msgId, item k of hintList)
+            {update_block}
             set successCount to successCount + 1
         end try
     end repeat
 
-    return successCount & " of " & (count of idList) & " messages updated"
+    return (successCount as text) & " of " & (count of idList) & " messages updated"
 end tell
 '''
 
+    @staticmethod
+    def bulk_set_read_status(
+        account_name: str,
+        mailbox_path: str,
+        message_ids: list[int],
+        read: bool,
+    ) -> str:
+        """Set read status for multiple messages."""
+        return Scripts.bulk_set_flags(account_name, mailbox_path, message_ids, read=read)
+
     @staticmethod
     def bulk_set_flagged_status(
         account_name: str,
@@ -497,28 +963,9 @@ end tell
         flagged: bool,
     ) -> str:
         """Set flagged status for multiple messages."""
-        account_name = esc(account_name)
-        mailbox_path = esc(mailbox_path)
-        ids_str = ", ".join(str(mid) for mid in message_ids)
-        flagged_val = "true" if flagged else "false"
-        return f'''
-tell application "Mail"
-    set acc to account "{account_name}"
-    set mb to mailbox "{mailbox_path}" of acc
-    set idList to {{{ids_str}}}
-    set successCount to 0
-
-    repeat with msgId in idList
-        try
-            set msg to first message of mb whose id is msgId
-            set flagged status of msg to {flagged_val}
-            set successCount to successCount + 1
-        end try
-    end repeat
-
-    return successCount & " of " & (count of idList) & " messages updated"
-end tell
-'''
+        return Scripts.bulk_set_flags(
+            account_name, mailbox_path, message_ids, flagged=flagged
+        )
 
     @staticmethod
     def create_mailbox(account_name: str, mailbox_name: str, parent_mailbox: str | None = None) -> str:
@@ -529,8 +976,7 @@ end tell
             parent_mailbox = esc(parent_mailbox)
             return f'''
 tell application "Mail"
-    set acc to account "{account_name}"
-    set parentMb to mailbox "{parent_mailbox}" of acc
+    set parentMb to mailbox "{parent_mailbox}" of account "{account_name}"
     make new mailbox with properties {{name:"{mailbox_name}"}} at parentMb
     return "created"
 end tell
@@ -552,8 +998,7 @@ end tell
         new_name = esc(new_name)
         return f'''
 tell application "Mail"
-    set acc to account "{account_name}"
-    set mb to mailbox "{mailbox_path}" of acc
+    set mb to mailbox "{mailbox_path}" of account "{account_name}"
     set name of mb to "{new_name}"
     return "renamed"
 end tell
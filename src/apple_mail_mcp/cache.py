@@ -0,0 +1,124 @@
+"""Small thread-safe in-memory cache with per-lookup expiry."""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """Maps tuple keys to values that expire after a caller-given TTL."""
+
+    def __init__(self):
+        self._data: dict[tuple, tuple[float, Any]] = {}
+        # Invalidation counts per invalidated prefix (() for clear), so that
+        # a result fetched before an invalidation is not stored after it
+        self._generations: dict[tuple, int] = {}
+        # FastMCP may run sync tools on worker threads
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, ttl: float) -> Any | None:
+        """
+        Return the cached value for key, or None if missing or older than ttl.
+
+        Args:
+            key: Cache key
+            ttl: Maximum age in seconds
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > ttl:
+                del self._data[key]
+                return None
+            return value
+
+    def generation(self, key: tuple) -> int:
+        """
+        Return a number that changes whenever key is invalidated.
+
+        Read it before computing a value and pass it to set(), so the value
+        is dropped if key was invalidated in the meantime.
+        """
+        with self._lock:
+            return self._generation(key)
+
+    def _generation(self, key: tuple) -> int:
+        # Counts only grow, so the sum changes with any matching invalidation
+        return sum(
+            count for prefix, count in self._generations.items()
+            if key[:len(prefix)] == prefix
+        )
+
+    def set(self, key: tuple, value: Any, generation: int | None = None) -> None:
+        """
+        Store value under key.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            generation: generation(key) from before value was computed; the
+                value is not stored if key was invalidated since
+        """
+        with self._lock:
+            if generation is not None and self._generation(key) != generation:
+                return
+            self._data[key] = (time.monotonic(), value)
+
+    def invalidate(self, *prefix: Hashable) -> None:
+        """Drop every entry whose key starts with prefix."""
+        size = len(prefix)
+        with self._lock:
+            self._generations[prefix] = self._generations.get(prefix, 0) + 1
+            for key in [k for k in self._data if k[:size] == prefix]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._generations[()] = self._generations.get((), 0) + 1
+            self._data.clear()
+
+
+class SingleFlight:
+    """Runs one call per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self):
+        self._calls: dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: tuple, fn: Callable[[], T]) -> T:
+        """
+        Call fn, or wait for the identical call already in flight.
+
+        Args:
+            key: Identifies the call (e.g. tool name and arguments)
+            fn: Function producing the result
+
+        Returns:
+            The result of fn; if fn raised, every waiting caller re-raises it
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
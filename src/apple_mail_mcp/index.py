@@ -0,0 +1,222 @@
+"""Local SQLite FTS5 index of message subjects, senders and bodies."""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = os.path.expanduser("~/Library/Caches/apple-mail-mcp/index.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mail_meta (
+    rowid INTEGER PRIMARY KEY,
+    account TEXT NOT NULL,
+    mailbox TEXT NOT NULL,
+    msg_id INTEGER NOT NULL,
+    date_received TEXT,
+    UNIQUE (account, mailbox, msg_id)
+);
+CREATE TABLE IF NOT EXISTS mail_indexed (
+    account TEXT NOT NULL,
+    mailbox TEXT NOT NULL,
+    indexed_at REAL NOT NULL,
+    message_count INTEGER NOT NULL,
+    PRIMARY KEY (account, mailbox)
+);
+"""
+
+# The trigram tokenizer (SQLite 3.34+) matches arbitrary substrings of three
+# or more characters, like AppleScript's "contains"; unicode61 only matches
+# whole words and is used when trigram is unavailable
+_FTS_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS mail_fts USING fts5(subject, sender, body, tokenize='{}')"
+
+
+class IndexedMessage(Protocol):
+    """Fields the index stores (satisfied by tools.messages.Message)."""
+
+    id: int
+    subject: str
+    sender: str
+    date: str
+    content: str
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class MailIndex:
+    """SQLite FTS5 shadow index of mailboxes, searched instead of Mail.app."""
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH):
+        """
+        Args:
+            path: SQLite database file (":memory:" for a throwaway index)
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+            try:
+                self._conn.execute(_FTS_SCHEMA.format("trigram"))
+                self._substring = True
+            except sqlite3.OperationalError:
+                self._conn.execute(_FTS_SCHEMA.format("unicode61"))
+                self._substring = False
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def is_indexed(self, account_name: str, mailbox_path: str) -> bool:
+        """Return True if the mailbox has been indexed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM mail_indexed WHERE account = ? AND mailbox = ?",
+                (account_name, mailbox_path),
+            ).fetchone()
+        return row is not None
+
+    def replace_mailbox(
+        self,
+        account_name: str,
+        mailbox_path: str,
+        messages: Iterable[IndexedMessage],
+    ) -> int:
+        """
+        Replace the indexed contents of a mailbox.
+
+        Args:
+            account_name: Name of the mail account
+            mailbox_path: Path to the mailbox
+            messages: Messages in mailbox order
+
+        Returns:
+            Number of messages indexed
+        """
+        # Fetch everything before taking the lock: messages may be a generator
+        # running AppleScript, which must not block searches of other mailboxes
+        messages = list(messages)
+        count = 0
+        with self._lock, self._conn:
+            self._delete_rows(account_name, mailbox_path)
+            for msg in messages:
+                cur = self._conn.execute(
+                    "INSERT OR REPLACE INTO mail_meta (account, mailbox, msg_id, date_received) "
+                    "VALUES (?, ?, ?, ?)",
+                    (account_name, mailbox_path, msg.id, msg.date),
+                )
+                self._conn.execute(
+                    "INSERT INTO mail_fts (rowid, subject, sender, body) VALUES (?, ?, ?, ?)",
+                    (cur.lastrowid, msg.subject, msg.sender, msg.content),
+                )
+                count += 1
+            self._conn.execute(
+                "INSERT OR REPLACE INTO mail_indexed (account, mailbox, indexed_at, message_count) "
+                "VALUES (?, ?, ?, ?)",
+                (account_name, mailbox_path, time.time(), count),
+            )
+
+        logger.info("Indexed %d messages in %s/%s", count, account_name, mailbox_path)
+        return count
+
+    def drop_mailbox(self, account_name: str, mailbox_path: str) -> None:
+        """Remove a mailbox from the index (it must be indexed again to be searched)."""
+        with self._lock, self._conn:
+            self._delete_rows(account_name, mailbox_path)
+            self._conn.execute(
+                "DELETE FROM mail_indexed WHERE account = ? AND mailbox = ?",
+                (account_name, mailbox_path),
+            )
+
+    def _delete_rows(self, account_name: str, mailbox_path: str) -> None:
+        key = (account_name, mailbox_path)
+        self._conn.execute(
+            "DELETE FROM mail_fts WHERE rowid IN "
+            "(SELECT rowid FROM mail_meta WHERE account = ? AND mailbox = ?)",
+            key,
+        )
+        self._conn.execute("DELETE FROM mail_meta WHERE account = ? AND mailbox = ?", key)
+
+    def search(
+        self,
+        account_name: str,
+        mailbox_path: str,
+        sender_contains: str | None = None,
+        subject_contains: str | None = None,
+        body_contains: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[int], int]:
+        """
+        Search an indexed mailbox (case-insensitive substring match).
+
+        Returns:
+            Tuple of (message IDs for the requested page in mailbox order,
+            total number of matches)
+        """
+        where = ["m.account = ?", "m.mailbox = ?"]
+        params: list = [account_name, mailbox_path]
+        match_terms = []
+
+        for column, term in (
+            ("sender", sender_contains),
+            ("subject", subject_contains),
+            ("body", body_contains),
+        ):
+            if not term:
+                continue
+            if self._substring and len(term) >= 3:
+                phrase = term.replace('"', '""')
+                match_terms.append(f'{column} : "{phrase}"')
+            else:
+                # Too short for trigrams (or no trigram tokenizer): scan the column
+                where.append(f"mail_fts.{column} LIKE ? ESCAPE '\\'")
+                params.append(_like_pattern(term))
+
+        if match_terms:
+            where.append("mail_fts MATCH ?")
+            params.append(" AND ".join(match_terms))
+
+        base = (
+            "FROM mail_fts JOIN mail_meta m ON m.rowid = mail_fts.rowid WHERE "
+            + " AND ".join(where)
+        )
+        with self._lock:
+            total = self._conn.execute(f"SELECT count(*) {base}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT m.msg_id {base} ORDER BY m.rowid LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            ).fetchall()
+
+        return [row[0] for row in rows], total
+
+
+_default_index: Optional[MailIndex] = None
+_default_lock = threading.Lock()
+
+
+def get_index() -> MailIndex:
+    """Return the shared MailIndex, opening it on first use."""
+    global _default_index
+    if _default_index is None:
+        with _default_lock:
+            if _default_index is None:
+                _default_index = MailIndex()
+    return _default_index
+
+
+def drop_mailbox(account_name: str, mailbox_path: str) -> None:
+    """Remove a mailbox from the shared index, if an index exists."""
+    if _default_index is None and not os.path.exists(DEFAULT_INDEX_PATH):
+        return
+    get_index().drop_mailbox(account_name, mailbox_path)
@@ -1,19 +1,26 @@
 """Apple Mail MCP Server - Main entry point."""
 
+import contextlib
 import logging
-from dataclasses import asdict
+import threading
 
 from mcp.server.fastmcp import FastMCP
 
-from .applescript.executor import AppleScriptExecutor, AppleScriptError
+from .applescript.executor import AppleScriptError, get_executor
+from .cache import SingleFlight, TTLCache
+from .index import get_index
 from .tools.accounts import list_accounts as _list_accounts
 from .tools.mailboxes import (
     list_mailboxes as _list_mailboxes,
+    list_all_mailboxes as _list_all_mailboxes,
     create_mailbox as _create_mailbox,
     rename_mailbox as _rename_mailbox,
 )
 from .tools.messages import (
+    PaginatedMessages,
+    index_mailbox as _index_mailbox,
     list_messages as _list_messages,
+    read_message as _read_message,
     read_messages as _read_messages,
     search_messages as _search_messages,
 )
@@ -21,6 +28,7 @@ from .tools.operations import (
     bulk_move_messages as _move_messages,
     bulk_set_status as _set_messages_status,
 )
+from .tools.snapshot import account_snapshot as _account_snapshot
 
 # Configure logging to file (never print to stdout - it corrupts JSON-RPC)
 logging.basicConfig(
@@ -34,7 +42,159 @@ logger = logging.getLogger(__name__)
 mcp = FastMCP("Apple Mail")
 
 # Shared executor instance
-executor = AppleScriptExecutor()
+executor = get_executor()
+
+# Short-lived results of read-only tools; agents often list the same
+# accounts/mailboxes several times within one turn
+cache = TTLCache()
+ACCOUNTS_TTL = 60
+MAILBOXES_TTL = 15
+MESSAGES_TTL = 15
+
+# Identical list_messages calls that overlap (parallel tool calls, prefetch)
+# share one osascript run instead of each queueing AppleEvents in Mail
+inflight = SingleFlight()
+
+# After list_mailboxes, the first page of the busiest mailboxes is fetched in
+# the background (unless scripts run in-process) so the usual follow-up
+# list_messages call is a cache hit.
+# Prefetching runs one script at a time and only while no tool call is
+# running; it gives up after waiting PREFETCH_WAIT seconds for a pause.
+PREFETCH_MAILBOXES = 5
+PREFETCH_WAIT = 10
+_prefetch_slots = threading.BoundedSemaphore(1)
+
+# Number of tool calls in progress
+_foreground_calls = 0
+_foreground_idle = threading.Condition()
+
+
+@contextlib.contextmanager
+def _foreground():
+    """Mark a tool call as running, holding off prefetching until it ends."""
+    global _foreground_calls
+    with _foreground_idle:
+        _foreground_calls += 1
+    try:
+        yield
+    finally:
+        with _foreground_idle:
+            _foreground_calls -= 1
+            if _foreground_calls == 0:
+                _foreground_idle.notify_all()
+
+
+def _messages_key(
+    account_name: str,
+    mailbox_path: str,
+    limit: int = 50,
+    offset: int = 0,
+    unread_only: bool = False,
+    flagged_only: bool = False,
+    include_content: bool = False,
+    content_limit: int | None = None,
+    return_total: bool = True,
+    since: str | None = None,
+) -> tuple:
+    """Cache key of a list_messages result."""
+    return (
+        "messages", account_name, mailbox_path, limit, offset, unread_only,
+        flagged_only, include_content, content_limit, return_total, since,
+    )
+
+
+def _cached_mailbox(account_name: str, mailbox_path: str) -> dict | None:
+    """Return the mailbox from a cached list_mailboxes result, if any."""
+    for include_nested in (True, False):
+        mailboxes = cache.get(("mailboxes", account_name, include_nested), MAILBOXES_TTL)
+        for mb in mailboxes or ():
+            if mb["path"] == mailbox_path:
+                return mb
+    return None
+
+
+def _fetch_messages(
+    account_name: str,
+    mailbox_path: str,
+    limit: int = 50,
+    offset: int = 0,
+    unread_only: bool = False,
+    flagged_only: bool = False,
+    include_content: bool = False,
+    content_limit: int | None = None,
+    return_total: bool = True,
+    since: str | None = None,
+) -> PaginatedMessages:
+    """list_messages through the TTL cache."""
+    key = _messages_key(
+        account_name, mailbox_path, limit, offset, unread_only, flagged_only,
+        include_content, content_limit, return_total, since,
+    )
+    result = cache.get(key, MESSAGES_TTL)
+    if result is None:
+        generation = cache.generation(key)
+        mailbox = _cached_mailbox(account_name, mailbox_path)
+        if mailbox is not None and mailbox["message_count"] == 0 and since is None:
+            # Known to be empty a moment ago: no need to ask Mail
+            return {
+                "messages": [],
+                "total": 0,
+                "offset": offset,
+                "limit": limit,
+                "has_more": False,
+                "cursor": None,
+            }
+        result = inflight.do(key, lambda: _list_messages(
+            executor, account_name, mailbox_path, limit, offset, unread_only, flagged_only,
+            include_content, content_limit, return_total=return_total, since=since,
+            as_dict=True,
+        ))
+        # Not stored if a move or status change invalidated it meanwhile
+        cache.set(key, result, generation)
+    return result
+
+
+def _load_mailboxes(account_name: str, include_nested: bool) -> list[dict]:
+    """List mailboxes into the cache and start prefetching their messages."""
+    key = ("mailboxes", account_name, include_nested)
+    generation = cache.generation(key)
+    mailboxes = _list_mailboxes(executor, account_name, include_nested, as_dict=True)
+    cache.set(key, mailboxes, generation)
+    # In-process scripts run one at a time, so a prefetch would only delay
+    # the next tool call
+    if executor.parallel:
+        threading.Thread(
+            target=_prefetch_messages, args=(account_name, mailboxes), daemon=True
+        ).start()
+    return mailboxes
+
+
+def _account_mailboxes(account_name: str, include_nested: bool) -> list[dict]:
+    """Return an account's mailboxes from the cache, listing them on a miss."""
+    mailboxes = cache.get(("mailboxes", account_name, include_nested), MAILBOXES_TTL)
+    if mailboxes is None:
+        mailboxes = _load_mailboxes(account_name, include_nested)
+    return mailboxes
+
+
+def _prefetch_messages(account_name: str, mailboxes: list[dict]) -> None:
+    """Warm the cache with the default first page of the busiest mailboxes."""
+    candidates = sorted(
+        (mb for mb in mailboxes if mb["message_count"] > 0),
+        key=lambda mb: mb["unread_count"],
+        reverse=True,
+    )[:PREFETCH_MAILBOXES]
+    for mb in candidates:
+        with _foreground_idle:
+            if not _foreground_idle.wait_for(lambda: _foreground_calls == 0, PREFETCH_WAIT):
+                logger.debug("Prefetch for '%s' skipped: tool calls kept running", account_name)
+                return
+        # One prefetch script at a time across all threads
+        with _prefetch_slots:
+            try:
+                _fetch_messages(account_name, mb["path"])
+            except (AppleScriptError, ValueError) as e:
+                logger.debug("Prefetch of '%s/%s' failed: %s", account_name, mb["path"], e)
 
 
 @mcp.tool()
@@ -45,15 +205,20 @@ def list_accounts() -> dict:
     Returns a list of accounts with their name, email, enabled status,
     and account type.
     """
-    try:
-        accounts = _list_accounts(executor)
-        return {
-            "success": True,
-            "data": [asdict(acc) for acc in accounts],
-        }
-    except AppleScriptError as e:
-        logger.error("Failed to list accounts: %s", e)
-        return {"success": False, "error": str(e), "data": []}
+    with _foreground():
+        try:
+            accounts = cache.get(("accounts",), ACCOUNTS_TTL)
+            if accounts is None:
+                generation = cache.generation(("accounts",))
+                accounts = _list_accounts(executor, as_dict=True)
+                cache.set(("accounts",), accounts, generation)
+            return {
+                "success": True,
+                "data": accounts,
+            }
+        except AppleScriptError as e:
+            logger.error("Failed to list accounts: %s", e)
+            return {"success": False, "error": str(e), "data": []}
 
 
 @mcp.tool()
@@ -66,16 +231,100 @@ def list_mailboxes(account_name: str, include_nested: bool = True) -> dict:
         include_nested: Whether to include nested mailboxes recursively (default: True)
 
     Returns a list of mailboxes with their path, message count, and unread count.
+    Results are cached for a few seconds. The first page of messages of the
+    mailboxes with the most unread mail is then loaded in the background, so a
+    following list_messages call with default arguments may return results that
+    are a few seconds old. An account that list_accounts just reported as
+    disabled has no mailboxes listed.
     """
-    try:
-        mailboxes = _list_mailboxes(executor, account_name, include_nested)
-        return {
-            "success": True,
-            "data": [asdict(mb) for mb in mailboxes],
-        }
-    except AppleScriptError as e:
-        logger.error("Failed to list mailboxes for '%s': %s", account_name, e)
-        return {"success": False, "error": str(e), "data": []}
+    with _foreground():
+        try:
+            accounts = cache.get(("accounts",), ACCOUNTS_TTL) or ()
+            if any(acc["name"] == account_name and not acc["enabled"] for acc in accounts):
+                # Disabled accounts are skipped, as in list_all_mailboxes
+                return {"success": True, "data": []}
+
+            return {
+                "success": True,
+                "data": _account_mailboxes(account_name, include_nested),
+            }
+        except AppleScriptError as e:
+            logger.error("Failed to list mailboxes for '%s': %s", account_name, e)
+            return {"success": False, "error": str(e), "data": []}
+
+
+@mcp.tool()
+async def list_all_mailboxes(include_nested: bool = True) -> dict:
+    """
+    List mailboxes (folders) of all enabled mail accounts at once.
+
+    Args:
+        include_nested: Whether to include nested mailboxes recursively (default: True)
+
+    Returns mailboxes keyed by account name. Accounts are listed in parallel
+    (one after another in in-process mode) and share list_mailboxes' cache;
+    accounts that fail are reported under "errors".
+    """
+    with _foreground():
+        try:
+            result = await _list_all_mailboxes(
+                executor, include_nested, as_dict=True,
+                load=lambda name: _account_mailboxes(name, include_nested),
+            )
+            return {
+                "success": True,
+                "data": result["mailboxes"],
+                "errors": result["errors"],
+            }
+        except AppleScriptError as e:
+            logger.error("Failed to list mailboxes for all accounts: %s", e)
+            return {"success": False, "error": str(e), "data": {}}
+
+
+@mcp.tool()
+def snapshot(account_name: str, messages_per_mailbox: int = 10) -> dict:
+    """
+    Get an overview of an account: its mailboxes and the first messages of each.
+
+    Args:
+        account_name: The name of the mail account (as shown in Mail.app)
+        messages_per_mailbox: Number of message summaries per mailbox (default: 10)
+
+    Returns the mailboxes (as list_mailboxes with nested mailboxes) and the
+    message summaries keyed by mailbox path, fetched with a single script.
+    Use this instead of list_mailboxes followed by list_messages calls; a
+    following list_messages call with limit=messages_per_mailbox is served
+    from the result for a few seconds.
+    """
+    with _foreground():
+        try:
+            mailboxes_key = ("mailboxes", account_name, True)
+            mailboxes_generation = cache.generation(mailboxes_key)
+            messages_generation = cache.generation(("messages", account_name))
+            result = _account_snapshot(executor, account_name, messages_per_mailbox, as_dict=True)
+
+            cache.set(mailboxes_key, result["mailboxes"], mailboxes_generation)
+            # Seeded only if no move or status change invalidated the account's
+            # listings while the snapshot ran
+            if messages_per_mailbox > 0 and cache.generation(("messages", account_name)) == messages_generation:
+                for mb in result["mailboxes"]:
+                    total = mb["message_count"]
+                    cache.set(_messages_key(account_name, mb["path"], messages_per_mailbox), {
+                        "messages": result["messages"][mb["path"]],
+                        "total": total,
+                        "offset": 0,
+                        "limit": messages_per_mailbox,
+                        "has_more": messages_per_mailbox < total,
+                        "cursor": None,
+                    })
+
+            return {
+                "success": True,
+                "data": result,
+            }
+        except AppleScriptError as e:
+            logger.error("Failed to snapshot account '%s': %s", account_name, e)
+            return {"success": False, "error": str(e), "data": {}}
 
 
 @mcp.tool()
@@ -88,6 +337,8 @@ def list_messages(
     flagged_only: bool = False,
     include_content: bool = False,
     content_limit: int | None = None,
+    return_total: bool = True,
+    since: str | None = None,
 ) -> dict:
     """
     List messages in a mailbox with optional filtering.
@@ -101,36 +352,42 @@ def list_messages(
         flagged_only: Only return flagged messages (default: False)
         include_content: Include message body content (default: False). When True,
             returns full message objects with to, cc, and content fields.
-        content_limit: Maximum characters per message body (default: None = full).
+        content_limit: Maximum characters per message body, at least 1 (default: None = full).
             Only used when include_content is True.
+        return_total: Count all matching messages (default: True). Set to False to
+            skip counting a large unfiltered mailbox; total is then -1 and has_more
+            is true whenever a full page was returned.
+        since: ISO 8601 date (e.g. "2024-05-01T09:00:00") or a previous response's
+            "cursor"; only list messages received at or after it. Not supported with
+            include_content. The response's "cursor" covers all pages and is the
+            value to pass as since on the next call to fetch only mail not listed yet.
 
     Returns a list of message summaries (or full messages if include_content=True).
     Summary includes: id, subject, sender, date, read status, flagged status.
     Full message adds: to, cc, content.
     """
-    try:
-        result = _list_messages(
-            executor, account_name, mailbox_path, limit, offset, unread_only, flagged_only,
-            include_content, content_limit
-        )
-        # Convert message objects to dicts
-        messages = [
-            asdict(msg) if hasattr(msg, "__dataclass_fields__") else msg
-            for msg in result["messages"]
-        ]
-        return {
-            "success": True,
-            "data": messages,
-            "total": result["total"],
-            "offset": result["offset"],
-            "limit": result["limit"],
-            "has_more": result["has_more"],
-        }
-    except AppleScriptError as e:
-        logger.error(
-            "Failed to list messages in '%s/%s': %s", account_name, mailbox_path, e
-        )
-        return {"success": False, "error": str(e), "data": [], "total": 0, "offset": offset, "limit": limit, "has_more": False}
+    with _foreground():
+        try:
+            result = _fetch_messages(
+                account_name, mailbox_path, limit, offset, unread_only, flagged_only,
+                include_content, content_limit, return_total, since
+            )
+            response = {
+                "success": True,
+                "data": result["messages"],
+                "total": result["total"],
+                "offset": result["offset"],
+                "limit": result["limit"],
+                "has_more": result["has_more"],
+            }
+            if result["cursor"] is not None:
+                response["cursor"] = result["cursor"]
+            return response
+        except (AppleScriptError, ValueError) as e:
+            logger.error(
+                "Failed to list messages in '%s/%s': %s", account_name, mailbox_path, e
+            )
+            return {"success": False, "error": str(e), "data": [], "total": 0, "offset": offset, "limit": limit, "has_more": False}
 
 
 @mcp.tool()
@@ -139,6 +396,7 @@ def read_messages(
     mailbox_path: str,
     message_ids: list[int],
     content_limit: int | None = None,
+    headers_only: bool = False,
 ) -> dict:
     """
     Read the full content of one or more messages.
@@ -147,25 +405,43 @@ def read_messages(
         account_name: The name of the mail account
         mailbox_path: Path to the mailbox containing the messages
         message_ids: List of message IDs to read (from list_messages or search_messages)
-        content_limit: Maximum characters to return per message body (default: None = full content)
+        content_limit: Maximum characters to return per message body, at least 1 (default: None = full content)
+        headers_only: Skip message bodies and return only headers and status (default: False).
+            Much faster for IMAP accounts, where bodies are downloaded on demand.
 
     Returns a list of full messages including subject, sender, recipients (to, cc),
     date, read/flagged status, and the message content/body.
     """
-    try:
-        messages = _read_messages(executor, account_name, mailbox_path, message_ids, content_limit)
-        return {
-            "success": True,
-            "data": [asdict(msg) if hasattr(msg, "__dataclass_fields__") else msg for msg in messages],
-        }
-    except AppleScriptError as e:
-        logger.error(
-            "Failed to read messages in '%s/%s': %s",
-            account_name,
-            mailbox_path,
-            e,
-        )
-        return {"success": False, "error": str(e), "data": []}
+    with _foreground():
+        try:
+            if len(message_ids) == 1:
+                # A single message is addressed directly (by its listed position
+                # when known) instead of through the mailbox's id column
+                try:
+                    messages = [_read_message(
+                        executor, account_name, mailbox_path, message_ids[0], content_limit,
+                        headers_only, as_dict=True,
+                    )]
+                except AppleScriptError as e:
+                    # Reported like an unreadable message of a multi-id read
+                    messages = [{"id": message_ids[0], "error": str(e)}]
+            else:
+                messages = _read_messages(
+                    executor, account_name, mailbox_path, message_ids, content_limit, headers_only,
+                    as_dict=True,
+                )
+            return {
+                "success": True,
+                "data": messages,
+            }
+        except (AppleScriptError, ValueError) as e:
+            logger.error(
+                "Failed to read messages in '%s/%s': %s",
+                account_name,
+                mailbox_path,
+                e,
+            )
+            return {"success": False, "error": str(e), "data": []}
 
 
 @mcp.tool()
@@ -176,9 +452,11 @@ def search_messages(
     subject_contains: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    return_total: bool = True,
+    body_contains: str | None = None,
 ) -> dict:
     """
-    Search messages by sender and/or subject.
+    Search messages by sender, subject and/or body.
 
     Args:
         account_name: The name of the mail account
@@ -187,31 +465,69 @@ def search_messages(
         subject_contains: Filter messages where subject contains this string
         limit: Maximum number of messages to return (default: 50)
         offset: Number of messages to skip for pagination (default: 0)
+        return_total: Count all matching messages (default: True). Only saves work
+            when no search terms are given; total is then -1.
+        body_contains: Filter messages where the body contains this string. Slow
+            unless the mailbox has been indexed with index_mailbox.
 
     Returns a list of message summaries matching the search criteria.
-    At least one of sender_contains or subject_contains should be provided.
+    At least one search term should be provided. Mailboxes indexed with
+    index_mailbox are searched in the local index instead of Mail.app.
     """
-    try:
-        result = _search_messages(
-            executor, account_name, mailbox_path, sender_contains, subject_contains, limit, offset
-        )
-        messages = [asdict(msg) for msg in result["messages"]]
-        return {
-            "success": True,
-            "data": messages,
-            "total": result["total"],
-            "offset": result["offset"],
-            "limit": result["limit"],
-            "has_more": result["has_more"],
-        }
-    except AppleScriptError as e:
-        logger.error(
-            "Failed to search messages in '%s/%s': %s",
-            account_name,
-            mailbox_path,
-            e,
-        )
-        return {"success": False, "error": str(e), "data": [], "total": 0, "offset": offset, "limit": limit, "has_more": False}
+    with _foreground():
+        try:
+            result = _search_messages(
+                executor, account_name, mailbox_path, sender_contains, subject_contains, limit, offset,
+                return_total, body_contains, get_index(), as_dict=True
+            )
+            return {
+                "success": True,
+                "data": result["messages"],
+                "total": result["total"],
+                "offset": result["offset"],
+                "limit": result["limit"],
+                "has_more": result["has_more"],
+            }
+        except AppleScriptError as e:
+            logger.error(
+                "Failed to search messages in '%s/%s': %s",
+                account_name,
+                mailbox_path,
+                e,
+            )
+            return {"success": False, "error": str(e), "data": [], "total": 0, "offset": offset, "limit": limit, "has_more": False}
+
+
+@mcp.tool()
+def index_mailbox(
+    account_name: str,
+    mailbox_path: str,
+    content_limit: int | None = None,
+) -> dict:
+    """
+    Build or refresh the local search index for a mailbox.
+
+    Args:
+        account_name: The name of the mail account
+        mailbox_path: Path to the mailbox to index
+        content_limit: Maximum characters of each body to index, at least 1 (default: None = full)
+
+    Once indexed, search_messages on this mailbox queries the local index
+    (fast substring search over sender, subject and body) instead of Mail.app.
+    New mail is only found after indexing again; moving messages or changing
+    their status drops the mailbox from the index.
+    """
+    with _foreground():
+        try:
+            count = _index_mailbox(
+                executor, get_index(), account_name, mailbox_path, content_limit=content_limit
+            )
+            return {"success": True, "indexed": count}
+        except (AppleScriptError, ValueError) as e:
+            logger.error(
+                "Failed to index '%s/%s': %s", account_name, mailbox_path, e
+            )
+            return {"success": False, "error": str(e)}
 
 
 @mcp.tool()
@@ -220,6 +536,7 @@ def move_messages(
     mailbox_path: str,
     message_ids: list[int],
     destination_mailbox: str,
+    return_new_ids: bool = True,
 ) -> dict:
     """
     Move one or more messages to another mailbox.
@@ -229,6 +546,8 @@ def move_messages(
         mailbox_path: Current mailbox path containing the messages
         message_ids: List of message IDs to move
         destination_mailbox: The destination mailbox path
+        return_new_ids: Look up the new message IDs after moving (default: True).
+            Set to False for faster moves when the new IDs are not needed.
 
     Returns success count and new message IDs (IDs change after moving).
 
@@ -236,23 +555,29 @@ def move_messages(
     (e.g., INBOX) due to Gmail's label-based system. Messages may appear in both
     locations. This is a Mail.app/AppleScript limitation with Gmail IMAP.
     """
-    try:
-        return _move_messages(
-            executor,
-            account_name,
-            mailbox_path,
-            message_ids,
-            destination_mailbox,
-        )
-    except AppleScriptError as e:
-        logger.error(
-            "Failed to move messages from '%s/%s' to '%s': %s",
-            account_name,
-            mailbox_path,
-            destination_mailbox,
-            e,
-        )
-        return {"success": False, "error": str(e)}
+    with _foreground():
+        try:
+            return _move_messages(
+                executor,
+                account_name,
+                mailbox_path,
+                message_ids,
+                destination_mailbox,
+                return_new_ids,
+            )
+        except AppleScriptError as e:
+            logger.error(
+                "Failed to move messages from '%s/%s' to '%s': %s",
+                account_name,
+                mailbox_path,
+                destination_mailbox,
+                e,
+            )
+            return {"success": False, "error": str(e)}
+        finally:
+            # Message and unread counts changed
+            cache.invalidate("mailboxes", account_name)
+            cache.invalidate("messages", account_name)
 
 
 @mcp.tool()
@@ -275,23 +600,28 @@ def set_messages_status(
 
     Returns success status and count of updated messages.
     """
-    try:
-        return _set_messages_status(
-            executor,
-            account_name,
-            mailbox_path,
-            message_ids,
-            read_status,
-            flagged_status,
-        )
-    except AppleScriptError as e:
-        logger.error(
-            "Failed to set status in '%s/%s': %s",
-            account_name,
-            mailbox_path,
-            e,
-        )
-        return {"success": False, "error": str(e)}
+    with _foreground():
+        try:
+            return _set_messages_status(
+                executor,
+                account_name,
+                mailbox_path,
+                message_ids,
+                read_status,
+                flagged_status,
+            )
+        except AppleScriptError as e:
+            logger.error(
+                "Failed to set status in '%s/%s': %s",
+                account_name,
+                mailbox_path,
+                e,
+            )
+            return {"success": False, "error": str(e)}
+        finally:
+            # Message and unread counts changed
+            cache.invalidate("mailboxes", account_name)
+            cache.invalidate("messages", account_name)
 
 
 @mcp.tool()
@@ -310,16 +640,19 @@ def create_mailbox(
 
     Returns success status.
     """
-    try:
-        return _create_mailbox(executor, account_name, mailbox_name, parent_mailbox)
-    except AppleScriptError as e:
-        logger.error(
-            "Failed to create mailbox '%s' in '%s': %s",
-            mailbox_name,
-            account_name,
-            e,
-        )
-        return {"success": False, "error": str(e)}
+    with _foreground():
+        try:
+            return _create_mailbox(executor, account_name, mailbox_name, parent_mailbox)
+        except AppleScriptError as e:
+            logger.error(
+                "Failed to create mailbox '%s' in '%s': %s",
+                mailbox_name,
+                account_name,
+                e,
+            )
+            return {"success": False, "error": str(e)}
+        finally:
+            cache.invalidate("mailboxes", account_name)
 
 
 @mcp.tool()
@@ -338,16 +671,19 @@ def rename_mailbox(
 
     Returns success status.
     """
-    try:
-        return _rename_mailbox(executor, account_name, mailbox_path, new_name)
-    except AppleScriptError as e:
-        logger.error(
-            "Failed to rename mailbox '%s' in '%s': %s",
-            mailbox_path,
-            account_name,
-            e,
-        )
-        return {"success": False, "error": str(e)}
+    with _foreground():
+        try:
+            return _rename_mailbox(executor, account_name, mailbox_path, new_name)
+        except AppleScriptError as e:
+            logger.error(
+                "Failed to rename mailbox '%s' in '%s': %s",
+                mailbox_path,
+                account_name,
+                e,
+            )
+            return {"success": False, "error": str(e)}
+        finally:
+            cache.invalidate("mailboxes", account_name)
 
 
 def main():
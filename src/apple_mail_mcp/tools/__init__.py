@@ -1,21 +1,25 @@
 """Mail operation tools."""
 
 from .accounts import list_accounts
-from .mailboxes import list_mailboxes, create_mailbox, rename_mailbox
-from .messages import list_messages, read_message, read_messages, search_messages
+from .mailboxes import list_mailboxes, list_all_mailboxes, create_mailbox, rename_mailbox
+from .messages import list_messages, read_message, read_messages, search_messages, index_mailbox
 from .operations import move_message, set_message_status, bulk_move_messages, bulk_set_status
+from .snapshot import account_snapshot
 
 __all__ = [
     "list_accounts",
     "list_mailboxes",
+    "list_all_mailboxes",
     "create_mailbox",
     "rename_mailbox",
     "list_messages",
     "read_message",
     "read_messages",
     "search_messages",
+    "index_mailbox",
     "move_message",
     "set_message_status",
     "bulk_move_messages",
     "bulk_set_status",
+    "account_snapshot",
 ]
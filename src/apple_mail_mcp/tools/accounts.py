@@ -2,15 +2,16 @@
 
 import logging
 from dataclasses import dataclass
+from typing import Iterator
 
-from ..applescript import RECORD_SEP
+from ..applescript import split_rows
 from ..applescript.executor import AppleScriptExecutor
 from ..applescript.scripts import Scripts
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """Represents a mail account."""
 
@@ -19,40 +20,43 @@ class Account:
     enabled: bool
     account_type: str
 
+    def to_dict(self) -> dict:
+        """Return the fields as a plain dict."""
+        return {
+            "name": self.name,
+            "email": self.email,
+            "enabled": self.enabled,
+            "account_type": self.account_type,
+        }
 
-def list_accounts(executor: AppleScriptExecutor) -> list[Account]:
+
+def list_accounts(executor: AppleScriptExecutor, as_dict: bool = False) -> list[Account] | list[dict]:
     """
     List all mail accounts configured in Apple Mail.
 
     Args:
         executor: The AppleScript executor instance
+        as_dict: Return the accounts as plain dicts instead of dataclasses
 
     Returns:
         List of Account objects
     """
-    script = Scripts.list_accounts()
-    output = executor.run(script)
-
-    accounts = []
-    for line in output.strip().split("\n"):
-        if not line.strip():
-            continue
-
-        parts = line.split(RECORD_SEP)
-        if len(parts) >= 4:
-            name = parts[0].strip()
-            email = parts[1].strip()
-            enabled = parts[2].strip().lower() == "true"
-            account_type = parts[3].strip()
-
-            accounts.append(
-                Account(
-                    name=name,
-                    email=email,
-                    enabled=enabled,
-                    account_type=account_type,
-                )
-            )
+    output = executor.run_compiled("list_accounts", Scripts.list_accounts())
+
+    rows = _iter_accounts(output)
+    accounts = list(rows) if as_dict else [Account(**row) for row in rows]
 
     logger.info("Found %d mail accounts", len(accounts))
     return accounts
+
+
+def _iter_accounts(output: str) -> Iterator[dict]:
+    """Parse RECORD_SEP/linefeed account rows into Account fields."""
+    fields = split_rows(output, 4)
+    for i in range(0, len(fields), 4):
+        yield {
+            "name": fields[i],
+            "email": fields[i + 1],
+            "enabled": fields[i + 2] == "true",
+            "account_type": fields[i + 3],
+        }
@@ -1,16 +1,20 @@
 """Mailbox listing tool."""
 
+import asyncio
 import logging
 from dataclasses import dataclass
+from typing import Callable, Iterator, TypedDict
 
-from ..applescript import RECORD_SEP
-from ..applescript.executor import AppleScriptExecutor
+from ..applescript import split_rows
+from ..applescript.executor import AppleScriptExecutor, AppleScriptError
 from ..applescript.scripts import Scripts
+from .accounts import list_accounts
+from .messages import invalidate_mailbox
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Mailbox:
     """Represents a mailbox/folder."""
 
@@ -18,12 +22,21 @@ class Mailbox:
     message_count: int
     unread_count: int
 
+    def to_dict(self) -> dict:
+        """Return the fields as a plain dict."""
+        return {
+            "path": self.path,
+            "message_count": self.message_count,
+            "unread_count": self.unread_count,
+        }
+
 
 def list_mailboxes(
     executor: AppleScriptExecutor,
     account_name: str,
     include_nested: bool = True,
-) -> list[Mailbox]:
+    as_dict: bool = False,
+) -> list[Mailbox] | list[dict]:
     """
     List mailboxes for a specific mail account.
 
@@ -31,40 +44,113 @@ def list_mailboxes(
         executor: The AppleScript executor instance
         account_name: Name of the mail account
         include_nested: Whether to include nested mailboxes recursively
+        as_dict: Return the mailboxes as plain dicts instead of dataclasses
 
     Returns:
         List of Mailbox objects
     """
-    script = Scripts.list_mailboxes(account_name, include_nested)
-    output = executor.run(script)
+    output = executor.run_compiled(
+        "list_mailboxes", Scripts.list_mailboxes_argv(include_nested), account_name
+    )
 
-    mailboxes = []
-    for line in output.strip().split("\n"):
-        if not line.strip():
-            continue
+    mailboxes = _parse_mailboxes(output, as_dict)
+    logger.info("Found %d mailboxes for account '%s'", len(mailboxes), account_name)
+    return mailboxes
 
-        parts = line.split(RECORD_SEP)
-        if len(parts) >= 3:
-            path = parts[0].strip()
-            try:
-                message_count = int(parts[1].strip())
-            except ValueError:
-                message_count = 0
+
+class AllMailboxes(TypedDict):
+    """Mailboxes of every account, with per-account errors."""
+    mailboxes: dict[str, list[Mailbox] | list[dict]]
+    errors: dict[str, str]
+
+
+async def list_all_mailboxes(
+    executor: AppleScriptExecutor,
+    include_nested: bool = True,
+    as_dict: bool = False,
+    load: Callable[[str], list[Mailbox] | list[dict]] | None = None,
+) -> AllMailboxes:
+    """
+    List mailboxes of all enabled accounts concurrently.
+
+    Each account is listed on its own worker thread, so with osascript the
+    accounts are walked in parallel instead of one after another. Executors
+    that cannot run scripts in parallel (in-process mode) list the accounts
+    one after another on the calling thread, as NSAppleScript is not
+    thread-safe.
+
+    Args:
+        executor: The AppleScript executor instance
+        include_nested: Whether to include nested mailboxes recursively
+        as_dict: Return the mailboxes as plain dicts instead of dataclasses
+        load: Lists the mailboxes of one account (default: list_mailboxes),
+            e.g. to serve them from a cache
+
+    Returns:
+        AllMailboxes dict mapping account names to their mailboxes; accounts
+        that could not be listed are reported in errors instead
+    """
+    if load is None:
+        def load(name: str) -> list[Mailbox] | list[dict]:
+            return list_mailboxes(executor, name, include_nested, as_dict)
+
+    if executor.parallel:
+        accounts = await asyncio.to_thread(list_accounts, executor)
+        names = [acc.name for acc in accounts if acc.enabled]
+        outputs = await asyncio.gather(
+            *(asyncio.to_thread(load, name) for name in names),
+            return_exceptions=True,
+        )
+    else:
+        accounts = list_accounts(executor)
+        names = [acc.name for acc in accounts if acc.enabled]
+        outputs = []
+        for name in names:
             try:
-                unread_count = int(parts[2].strip())
-            except ValueError:
-                unread_count = 0
-
-            mailboxes.append(
-                Mailbox(
-                    path=path,
-                    message_count=message_count,
-                    unread_count=unread_count,
-                )
-            )
+                outputs.append(load(name))
+            except AppleScriptError as e:
+                outputs.append(e)
+
+    result: AllMailboxes = {"mailboxes": {}, "errors": {}}
+    for name, output in zip(names, outputs):
+        if isinstance(output, AppleScriptError):
+            logger.error("Failed to list mailboxes for '%s': %s", name, output)
+            result["errors"][name] = str(output)
+        elif isinstance(output, BaseException):
+            raise output
+        else:
+            result["mailboxes"][name] = output
 
-    logger.info("Found %d mailboxes for account '%s'", len(mailboxes), account_name)
-    return mailboxes
+    logger.info(
+        "Listed mailboxes for %d/%d accounts", len(result["mailboxes"]), len(names)
+    )
+    return result
+
+
+def _parse_mailboxes(output: str, as_dict: bool = False) -> list[Mailbox] | list[dict]:
+    """Parse RECORD_SEP/linefeed mailbox rows."""
+    rows = _iter_mailboxes(output)
+    return list(rows) if as_dict else [Mailbox(**row) for row in rows]
+
+
+def _iter_mailboxes(output: str) -> Iterator[dict]:
+    """Yield the Mailbox fields of each row."""
+    fields = split_rows(output, 3)
+    for i in range(0, len(fields), 3):
+        try:
+            message_count = int(fields[i + 1])
+        except ValueError:
+            message_count = 0
+        try:
+            unread_count = int(fields[i + 2])
+        except ValueError:
+            unread_count = 0
+
+        yield {
+            "path": fields[i],
+            "message_count": message_count,
+            "unread_count": unread_count,
+        }
 
 
 def create_mailbox(
@@ -89,6 +175,9 @@ def create_mailbox(
     executor.run(script)
 
     location = f"{parent_mailbox}/{mailbox_name}" if parent_mailbox else mailbox_name
+    # A mailbox deleted and created again under this path must not be served
+    # from listings of the old one
+    invalidate_mailbox(account_name, location)
     logger.info("Created mailbox '%s' in account '%s'", location, account_name)
 
     return {
@@ -118,6 +207,9 @@ def rename_mailbox(
     script = Scripts.rename_mailbox(account_name, mailbox_path, new_name)
     executor.run(script)
 
+    parent, _, _ = mailbox_path.rpartition("/")
+    invalidate_mailbox(account_name, mailbox_path)
+    invalidate_mailbox(account_name, f"{parent}/{new_name}" if parent else new_name)
     logger.info(
         "Renamed mailbox '%s' to '%s' in account '%s'",
         mailbox_path,
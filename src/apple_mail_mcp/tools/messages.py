@@ -1,17 +1,24 @@
 """Message listing and reading tools."""
 
 import logging
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TypedDict
+from typing import Iterable, Iterator, TypedDict
 
-from ..applescript import RECORD_SEP, UNIT_SEP, GROUP_SEP
-from ..applescript.executor import AppleScriptExecutor
+from ..applescript import UNIT_SEP, GROUP_SEP, split_rows
+from ..applescript.executor import AppleScriptExecutor, AppleScriptError
 from ..applescript.scripts import Scripts
+from ..index import MailIndex, drop_mailbox
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageSummary:
     """Summary information about a message."""
 
@@ -22,8 +29,19 @@ class MessageSummary:
     is_read: bool
     is_flagged: bool
 
+    def to_dict(self) -> dict:
+        """Return the fields as a plain dict."""
+        return {
+            "id": self.id,
+            "subject": self.subject,
+            "sender": self.sender,
+            "date": self.date,
+            "is_read": self.is_read,
+            "is_flagged": self.is_flagged,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class Message:
     """Full message content."""
 
@@ -37,14 +55,87 @@ class Message:
     is_flagged: bool
     content: str
 
+    def to_dict(self) -> dict:
+        """Return the fields as a plain dict."""
+        return {
+            "id": self.id,
+            "subject": self.subject,
+            "sender": self.sender,
+            "to": self.to,
+            "cc": self.cc,
+            "date": self.date,
+            "is_read": self.is_read,
+            "is_flagged": self.is_flagged,
+            "content": self.content,
+        }
+
 
 class PaginatedMessages(TypedDict):
     """Paginated message list with metadata."""
-    messages: list[MessageSummary] | list[Message]
+    messages: list[MessageSummary] | list[Message] | list[dict]
     total: int
     offset: int
     limit: int
     has_more: bool
+    cursor: str | None
+
+
+# read_messages reads larger requests in chunks, two scripts at a time, when
+# the executor runs scripts in parallel and every message's position is known
+# (so no chunk has to fetch the mailbox's id column): each osascript then
+# holds fewer bodies, Mail overlaps the work and a failing chunk does not
+# fail the others
+READ_CHUNK_SIZE = 25
+_read_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="read-messages")
+
+# Summary listings are served from a cached window of the mailbox's first
+# messages (at offset 0), so paging through a mailbox does not run a script
+# per page. Mutations bump the mailbox's generation, which is part of the
+# window key, so stale windows are never used.
+WINDOW_TTL = 30
+WINDOW_MIN_SIZE = 64
+WINDOW_MAX_SIZE = 1024
+_MAX_WINDOWS = 32
+_windows: OrderedDict[tuple, tuple[float, int, int, list[dict]]] = OrderedDict()
+_window_lock = threading.Lock()
+_generations: dict[tuple[str, str], int] = {}
+
+
+def invalidate_mailbox(account_name: str, mailbox_path: str) -> None:
+    """Drop cached listings and index rows of a mailbox after its messages changed."""
+    with _window_lock:
+        key = (account_name, mailbox_path)
+        _generations[key] = _generations.get(key, 0) + 1
+    drop_mailbox(account_name, mailbox_path)
+
+
+# Mailbox positions of the messages on the last unfiltered page listed per
+# (account, mailbox). Message scripts (single and bulk reads, moves and
+# status changes) use them to address a message directly instead of scanning
+# the mailbox; a stale position is detected in the script and falls back to
+# the scan.
+_index_hints: dict[tuple[str, str], dict[int, int]] = {}
+
+
+def _remember_positions(
+    account_name: str, mailbox_path: str, offset: int, message_ids: list[int]
+) -> None:
+    _index_hints[(account_name, mailbox_path)] = {
+        msg_id: offset + i for i, msg_id in enumerate(message_ids, start=1)
+    }
+
+
+def index_hint(account_name: str, mailbox_path: str, message_id: int) -> int | None:
+    """Return the last known mailbox position of a message, if any."""
+    return _index_hints.get((account_name, mailbox_path), {}).get(message_id)
+
+
+def index_hints(
+    account_name: str, mailbox_path: str, message_ids: list[int]
+) -> list[int | None]:
+    """Return the last known mailbox positions of messages (see index_hint)."""
+    positions = _index_hints.get((account_name, mailbox_path), {})
+    return [positions.get(msg_id) for msg_id in message_ids]
 
 
 def _parse_total_count(output: str) -> tuple[int, str]:
@@ -56,18 +147,315 @@ def _parse_total_count(output: str) -> tuple[int, str]:
     Returns:
         Tuple of (total_count, remaining_output)
     """
-    lines = output.split("\n", 1)
-    total = 0
-    remaining = output
+    if not output.startswith("TOTAL:"):
+        return 0, output
+
+    # find + slice: no intermediate list of the (possibly large) output
+    newline = output.find("\n")
+    if newline < 0:
+        newline = len(output)
+    try:
+        total = int(output[6:newline])
+    except ValueError:
+        total = 0
+    return total, output[newline + 1:]
+
+
+def _parse_cursor(output: str) -> tuple[str | None, str]:
+    """Extract an optional "CURSOR:<date>" line from the start of output."""
+    if not output.startswith("CURSOR:"):
+        return None, output
+    line, _, remaining = output.partition("\n")
+    return line[7:].strip(), remaining
+
+
+def _has_more(offset: int, limit: int, count: int, total: int) -> bool:
+    """Whether more messages follow this page; total is -1 when not counted."""
+    if total < 0:
+        return count >= limit
+    return offset + count < total
+
+# Number of UNIT_SEP-separated header fields before the content field
+_HEADER_FIELDS = 8
+
+# Start of the next message record: the numeric id and the other header
+# fields, or an ERROR marker, each followed by UNIT_SEP. Matching the whole
+# header keeps text like "<GS>12<US>" inside a body from passing for a record.
+_RECORD_START_RE = re.compile(
+    rf"\d+{UNIT_SEP}(?:ERROR{UNIT_SEP}|(?:[^{UNIT_SEP}{GROUP_SEP}]*{UNIT_SEP}){{{_HEADER_FIELDS - 1}}})"
+)
+
+
+def _content_end(output: str, start: int, length: int) -> int:
+    """Find the GROUP_SEP that terminates a length-prefixed content field.
+
+    The length is AppleScript's character count, which can differ slightly
+    from the Python code point count (combining sequences, emoji). The
+    GROUP_SEP closest to the expected position that is followed by a new
+    record (or the end of output) is used, checking the exact position first.
+    """
+    size = len(output)
+    end = min(start + length, size)
+
+    def is_boundary(pos: int) -> bool:
+        return pos + 1 == size or _RECORD_START_RE.match(output, pos + 1) is not None
+
+    if end < size and output[end] == GROUP_SEP and is_boundary(end):
+        return end
+
+    after = output.find(GROUP_SEP, end)
+    while after >= 0 and not is_boundary(after):
+        after = output.find(GROUP_SEP, after + 1)
 
-    if lines and lines[0].startswith("TOTAL:"):
+    before = output.rfind(GROUP_SEP, start, end)
+    while before >= 0 and not is_boundary(before):
+        before = output.rfind(GROUP_SEP, start, before)
+
+    if after < 0 and before < 0:
+        return size
+    if after < 0:
+        return before
+    if before < 0:
+        return after
+    return before if end - before < after - end else after
+
+
+def _iter_message_records(output: str) -> Iterator[list[str]]:
+    """Split full-message output into records.
+
+    Each record is either the 8 header fields plus the content, or
+    [id, "ERROR", message] for messages that could not be read. Content is
+    prefixed with its length ("<len>:") so it may contain any delimiter.
+    """
+    pos = 0
+    size = len(output)
+    while pos < size:
+        fields = []
+        for _ in range(_HEADER_FIELDS):
+            sep = output.find(UNIT_SEP, pos)
+            if sep < 0:
+                break
+            fields.append(output[pos:sep])
+            pos = sep + 1
+
+            if len(fields) == 2 and fields[1].strip() == "ERROR":
+                group = output.find(GROUP_SEP, pos)
+                if group < 0:
+                    group = size
+                if output.find(UNIT_SEP, pos, group) < 0:
+                    fields.append(output[pos:group])
+                    pos = group + 1
+                    break
+
+        if len(fields) == 3 and fields[1].strip() == "ERROR":
+            yield fields
+            continue
+        if len(fields) < _HEADER_FIELDS:
+            return
+
+        length_str, colon, _ = output[pos:pos + 20].partition(":")
         try:
-            total = int(lines[0][6:])
+            length = int(length_str) if colon else -1
         except ValueError:
-            pass
-        remaining = lines[1] if len(lines) > 1 else ""
+            length = -1
+
+        if length < 0:
+            # Unframed content: read up to the next GROUP_SEP
+            end = output.find(GROUP_SEP, pos)
+            end = size if end < 0 else end
+            fields.append(output[pos:end])
+        else:
+            start = pos + len(length_str) + 1
+            end = _content_end(output, start, length)
+            fields.append(output[start:end])
+
+        pos = end + 1
+        yield fields
+
+
+# Senders repeat across a mailbox (newsletters, notifications); short ones are
+# interned so that the parsed rows share one string per sender
+_INTERN_MAX_LEN = 128
+
+
+def _intern(value: str) -> str:
+    return sys.intern(value) if len(value) < _INTERN_MAX_LEN else value
+
+
+def _message_from_record(parts: list[str], msg_id: int, content: str) -> dict:
+    """Build Message fields from a full-message record's header fields."""
+    return {
+        "id": msg_id,
+        "subject": parts[1],
+        "sender": _intern(parts[2]),
+        "to": parts[3],
+        "cc": parts[4],
+        "date": parts[5],
+        "is_read": parts[6] == "true",
+        "is_flagged": parts[7] == "true",
+        "content": content,
+    }
+
+
+def _iter_summaries(output: str) -> Iterator[dict]:
+    """Parse RECORD_SEP/linefeed summary rows (after the TOTAL line) into
+    MessageSummary fields."""
+    fields = split_rows(output, 6)
+    for i in range(0, len(fields), 6):
+        try:
+            msg_id = int(fields[i])
+        except ValueError:
+            continue
+
+        yield {
+            "id": msg_id,
+            "subject": fields[i + 1],
+            "sender": _intern(fields[i + 2]),
+            "date": fields[i + 3],
+            "is_read": fields[i + 4] == "true",
+            "is_flagged": fields[i + 5] == "true",
+        }
 
-    return total, remaining
+
+def _parse_summary_stream(chunks: Iterable[str]) -> tuple[int, str | None, list[dict]]:
+    """Parse streamed summary output (see AppleScriptExecutor.stream).
+
+    Returns:
+        Tuple of (total count, cursor or None, MessageSummary fields)
+    """
+    total = 0
+    cursor = None
+    rows: list[dict] = []
+    for chunk in chunks:
+        if not rows:
+            # The TOTAL and CURSOR lines come first, possibly in separate chunks
+            if chunk.startswith("TOTAL:"):
+                total, chunk = _parse_total_count(chunk)
+            if chunk.startswith("CURSOR:"):
+                cursor, chunk = _parse_cursor(chunk)
+        rows.extend(_iter_summaries(chunk))
+    return total, cursor, rows
+
+
+def _fetch_page(
+    executor: AppleScriptExecutor,
+    account_name: str,
+    mailbox_path: str,
+    limit: int,
+    offset: int,
+    unread_only: bool,
+    flagged_only: bool,
+    include_content: bool,
+    content_limit: int | None,
+    return_total: bool,
+    since: str | None,
+) -> tuple[int, str | None, list[dict]]:
+    """Run one list_messages script (see list_messages).
+
+    Returns:
+        Tuple of (total count, cursor or None, Message/MessageSummary fields)
+    """
+    rows: list[dict] = []
+
+    if not include_content:
+        script = Scripts.list_messages(
+            account_name, mailbox_path, limit, offset, unread_only, flagged_only,
+            False, None, return_total, since
+        )
+        # Parse the simple RECORD_SEP format (summary only) as it is read
+        total, cursor, rows = _parse_summary_stream(executor.stream(script, timeout=60))
+    else:
+        script = Scripts.list_messages(
+            account_name, mailbox_path, limit, offset, unread_only, flagged_only,
+            True, content_limit, return_total, since
+        )
+        # Use longer timeout when fetching content
+        output = executor.run(script, timeout=120)
+
+        # Extract total count
+        total, output = _parse_total_count(output)
+        cursor, output = _parse_cursor(output)
+
+        # Parse the length-prefixed content records (same as read_messages)
+        for parts in _iter_message_records(output):
+            if len(parts) < 9:
+                continue
+
+            try:
+                msg_id = int(parts[0])
+            except ValueError:
+                continue
+
+            # content_limit (and its "...") is applied in AppleScript
+            rows.append(_message_from_record(parts, msg_id, parts[8]))
+
+    if not (unread_only or flagged_only or since):
+        # Unfiltered pages are contiguous ranges of the mailbox
+        _remember_positions(account_name, mailbox_path, offset, [row["id"] for row in rows])
+
+    return total, cursor, rows
+
+
+def _window_page(
+    executor: AppleScriptExecutor,
+    account_name: str,
+    mailbox_path: str,
+    limit: int,
+    offset: int,
+    unread_only: bool,
+    flagged_only: bool,
+    return_total: bool,
+) -> tuple[int, list[dict], bool]:
+    """Serve a summary page from the cached window starting at offset 0.
+
+    The window is fetched with the next power of two of offset + limit
+    messages, so paging forward refetches only every time the window size
+    doubles.
+
+    Returns:
+        Tuple of (total count, MessageSummary fields of the page, has_more)
+    """
+    key = (
+        account_name, mailbox_path, unread_only, flagged_only, return_total,
+        _generations.get((account_name, mailbox_path), 0),
+    )
+    end = offset + limit
+
+    with _window_lock:
+        entry = _windows.get(key)
+        if entry is not None:
+            stored_at, size, total, rows = entry
+            if time.monotonic() - stored_at > WINDOW_TTL or (end > size and len(rows) == size):
+                # Expired, or too small while the mailbox has more messages
+                entry = None
+            else:
+                _windows.move_to_end(key)
+
+    if entry is None:
+        size = max(WINDOW_MIN_SIZE, 1 << (end - 1).bit_length())
+        total, _, rows = _fetch_page(
+            executor, account_name, mailbox_path, size, 0, unread_only, flagged_only,
+            False, None, return_total, None,
+        )
+        with _window_lock:
+            _windows[key] = (time.monotonic(), size, total, rows)
+            _windows.move_to_end(key)
+            while len(_windows) > _MAX_WINDOWS:
+                _windows.popitem(last=False)
+
+    page = rows[offset:end]
+    if total >= 0:
+        has_more = offset + len(page) < total
+    else:
+        # Uncounted: more follow if the window goes past the page or is full
+        has_more = end < len(rows) or len(rows) == size
+    return total, page, has_more
+
+
+def _check_content_limit(content_limit: int | None) -> None:
+    """Reject a content_limit that would cut every body to nothing."""
+    if content_limit is not None and content_limit < 1:
+        raise ValueError(f"content_limit must be at least 1, got {content_limit}")
 
 
 def list_messages(
@@ -80,6 +468,9 @@ def list_messages(
     flagged_only: bool = False,
     include_content: bool = False,
     content_limit: int | None = None,
+    return_total: bool = True,
+    since: str | None = None,
+    as_dict: bool = False,
 ) -> PaginatedMessages:
     """
     List messages in a mailbox with optional filtering.
@@ -93,87 +484,47 @@ def list_messages(
         unread_only: Only return unread messages
         flagged_only: Only return flagged messages
         include_content: If True, include message body content (returns Message objects)
-        content_limit: Maximum characters per message body (only used with include_content)
+        content_limit: Maximum characters per message body, at least 1 (only used
+            with include_content)
+        return_total: Count the matching messages. When False an unfiltered
+            listing skips the count, total is -1 and has_more means a full
+            page was returned.
+        since: ISO 8601 date, or the cursor of a previous call; only list
+            messages received at or after it (summary listings only).
+            The result's cursor covers all matches, not just this page, and
+            is the value to pass as since on the next call to get only the
+            messages not listed yet.
+        as_dict: Return the messages as plain dicts instead of dataclasses
 
     Returns:
         PaginatedMessages dict with messages list and pagination metadata
-    """
-    script = Scripts.list_messages(
-        account_name, mailbox_path, limit, offset, unread_only, flagged_only,
-        include_content, content_limit
-    )
-    # Use longer timeout when fetching content
-    timeout = 120 if include_content else 60
-    output = executor.run(script, timeout=timeout)
-
-    # Extract total count
-    total, output = _parse_total_count(output)
 
-    messages: list[MessageSummary] | list[Message] = []
-
-    if include_content:
-        # Parse the GROUP_SEP / UNIT_SEP format (same as read_messages)
-        msg_blocks = output.split(GROUP_SEP)
-        for block in msg_blocks:
-            if not block.strip():
-                continue
-
-            parts = block.split(UNIT_SEP)
-            if len(parts) < 9:
-                continue
-
-            try:
-                msg_id = int(parts[0].strip())
-            except ValueError:
-                continue
-
-            content = parts[8] if len(parts) > 8 else ""
-            # Note: content_limit is already applied in AppleScript, but add "..." indicator
-            if content_limit is not None and len(content) > content_limit:
-                content = content + "..."
-
-            messages.append(
-                Message(
-                    id=msg_id,
-                    subject=parts[1].strip(),
-                    sender=parts[2].strip(),
-                    to=parts[3].strip(),
-                    cc=parts[4].strip(),
-                    date=parts[5].strip(),
-                    is_read=parts[6].strip().lower() == "true",
-                    is_flagged=parts[7].strip().lower() == "true",
-                    content=content,
-                )
-            )
+    Raises:
+        ValueError: If content_limit is less than 1, or since is used with
+            include_content
+    """
+    _check_content_limit(content_limit)
+    if since is not None and include_content:
+        raise ValueError("since is only supported for summary listings")
+    if include_content or since is not None or offset + limit > WINDOW_MAX_SIZE:
+        total, cursor, rows = _fetch_page(
+            executor, account_name, mailbox_path, limit, offset, unread_only, flagged_only,
+            include_content, content_limit, return_total, since,
+        )
+        has_more = _has_more(offset, limit, len(rows), total)
     else:
-        # Parse the simple RECORD_SEP format (summary only)
-        for line in output.strip().split("\n"):
-            if not line.strip():
-                continue
-
-            parts = line.split(RECORD_SEP)
-            if len(parts) >= 6:
-                try:
-                    msg_id = int(parts[0].strip())
-                except ValueError:
-                    continue
-
-                subject = parts[1].strip()
-                sender = parts[2].strip()
-                date = parts[3].strip()
-                is_read = parts[4].strip().lower() == "true"
-                is_flagged = parts[5].strip().lower() == "true"
-
-                messages.append(
-                    MessageSummary(
-                        id=msg_id,
-                        subject=subject,
-                        sender=sender,
-                        date=date,
-                        is_read=is_read,
-                        is_flagged=is_flagged,
-                    )
-                )
+        total, rows, has_more = _window_page(
+            executor, account_name, mailbox_path, limit, offset, unread_only, flagged_only,
+            return_total,
+        )
+        cursor = None
+
+    messages: list[MessageSummary] | list[Message] | list[dict]
+    if as_dict:
+        messages = rows
+    else:
+        cls = Message if include_content else MessageSummary
+        messages = [cls(**row) for row in rows]
 
     logger.info(
         "Found %d messages in %s/%s (total: %d)", len(messages), account_name, mailbox_path, total
@@ -184,7 +535,8 @@ def list_messages(
         "total": total,
         "offset": offset,
         "limit": limit,
-        "has_more": offset + len(messages) < total,
+        "has_more": has_more,
+        "cursor": cursor,
     }
 
 
@@ -193,42 +545,88 @@ def read_message(
     account_name: str,
     mailbox_path: str,
     message_id: int,
-) -> Message:
+    content_limit: int | None = None,
+    headers_only: bool = False,
+    as_dict: bool = False,
+) -> Message | dict:
     """
     Read full message content by ID.
 
+    Addresses the message by its position from a recent listing when known,
+    so it is cheaper than read_messages for a single message.
+
     Args:
         executor: The AppleScript executor instance
         account_name: Name of the mail account
         mailbox_path: Path to the mailbox
         message_id: AppleScript message ID
+        content_limit: Maximum characters to return of the body, at least 1
+            (None = full content)
+        headers_only: Return headers and status only, with empty content
+        as_dict: Return a plain dict instead of a Message
 
     Returns:
         Message object with full content
+
+    Raises:
+        ValueError: If content_limit is less than 1
     """
-    script = Scripts.read_message(account_name, mailbox_path, message_id)
+    _check_content_limit(content_limit)
+    script = Scripts.read_message(
+        account_name, mailbox_path, message_id,
+        index_hint(account_name, mailbox_path, message_id), headers_only, content_limit,
+    )
     output = executor.run(script, timeout=60)
 
-    parts = output.split(UNIT_SEP)
+    parts = next(_iter_message_records(output), [])
     if len(parts) < 9:
         raise ValueError(f"Invalid message response format: got {len(parts)} parts")
 
     try:
-        msg_id = int(parts[0].strip())
+        msg_id = int(parts[0])
     except ValueError:
         msg_id = message_id
 
-    return Message(
-        id=msg_id,
-        subject=parts[1].strip(),
-        sender=parts[2].strip(),
-        to=parts[3].strip(),
-        cc=parts[4].strip(),
-        date=parts[5].strip(),
-        is_read=parts[6].strip().lower() == "true",
-        is_flagged=parts[7].strip().lower() == "true",
-        content=parts[8] if len(parts) > 8 else "",
+    # content_limit (and its "...") is applied in AppleScript
+    fields = _message_from_record(parts, msg_id, parts[8])
+    return fields if as_dict else Message(**fields)
+
+
+def _read_chunk(
+    executor: AppleScriptExecutor,
+    account_name: str,
+    mailbox_path: str,
+    message_ids: list[int],
+    content_limit: int | None,
+    headers_only: bool,
+    as_dict: bool,
+) -> list[Message | dict]:
+    """Read messages with one script (see read_messages)."""
+    script = Scripts.read_messages(
+        account_name, mailbox_path, message_ids, headers_only, content_limit,
+        index_hints(account_name, mailbox_path, message_ids),
     )
+    output = executor.run(script, timeout=120)
+
+    messages: list[Message | dict] = []
+
+    for parts in _iter_message_records(output):
+        try:
+            msg_id = int(parts[0])
+        except ValueError:
+            continue
+
+        # Check for error
+        if len(parts) == 3 and parts[1].strip() == "ERROR":
+            messages.append({"id": msg_id, "error": parts[2].strip()})
+            continue
+
+        if len(parts) >= 9:
+            # content_limit (and its "...") is applied in AppleScript
+            fields = _message_from_record(parts, msg_id, parts[8])
+            messages.append(fields if as_dict else Message(**fields))
+
+    return messages
 
 
 def read_messages(
@@ -237,61 +635,70 @@ def read_messages(
     mailbox_path: str,
     message_ids: list[int],
     content_limit: int | None = None,
+    headers_only: bool = False,
+    as_dict: bool = False,
 ) -> list[Message | dict]:
     """
     Read multiple messages by their IDs in a single call.
 
+    More than READ_CHUNK_SIZE IDs are read in chunks, two scripts at a time,
+    if the executor runs scripts in parallel and all messages have an index
+    hint; otherwise with one script. The IDs of a chunk whose script fails
+    are returned as error dicts.
+
     Args:
         executor: The AppleScript executor instance
         account_name: Name of the mail account
         mailbox_path: Path to the mailbox
         message_ids: List of AppleScript message IDs
-        content_limit: Maximum characters to return per message body (None = full content)
+        content_limit: Maximum characters to return per message body, at least 1
+            (None = full content)
+        headers_only: Return headers and status only, with empty content
+        as_dict: Return the messages as plain dicts instead of dataclasses
 
     Returns:
         List of Message objects (or error dicts for failed reads)
-    """
-    script = Scripts.read_messages(account_name, mailbox_path, message_ids)
-    output = executor.run(script, timeout=120)
-
-    messages: list[Message | dict] = []
-    msg_blocks = output.split(GROUP_SEP)
-
-    for block in msg_blocks:
-        if not block.strip():
-            continue
-
-        parts = block.split(UNIT_SEP)
-        if len(parts) < 2:
-            continue
-
-        try:
-            msg_id = int(parts[0].strip())
-        except ValueError:
-            continue
-
-        # Check for error
-        if len(parts) >= 3 and parts[1].strip() == "ERROR":
-            messages.append({"id": msg_id, "error": parts[2].strip()})
-            continue
 
-        if len(parts) >= 9:
-            content = parts[8] if len(parts) > 8 else ""
-            if content_limit is not None and len(content) > content_limit:
-                content = content[:content_limit] + "..."
-            messages.append(
-                Message(
-                    id=msg_id,
-                    subject=parts[1].strip(),
-                    sender=parts[2].strip(),
-                    to=parts[3].strip(),
-                    cc=parts[4].strip(),
-                    date=parts[5].strip(),
-                    is_read=parts[6].strip().lower() == "true",
-                    is_flagged=parts[7].strip().lower() == "true",
-                    content=content,
-                )
+    Raises:
+        ValueError: If content_limit is less than 1
+    """
+    _check_content_limit(content_limit)
+    if not message_ids:
+        return []
+
+    if (
+        len(message_ids) <= READ_CHUNK_SIZE
+        or not executor.parallel
+        or None in index_hints(account_name, mailbox_path, message_ids)
+    ):
+        messages = _read_chunk(
+            executor, account_name, mailbox_path, message_ids, content_limit, headers_only,
+            as_dict,
+        )
+    else:
+        chunks = [
+            message_ids[i:i + READ_CHUNK_SIZE]
+            for i in range(0, len(message_ids), READ_CHUNK_SIZE)
+        ]
+        futures = [
+            _read_pool.submit(
+                _read_chunk, executor, account_name, mailbox_path, chunk,
+                content_limit, headers_only, as_dict,
             )
+            for chunk in chunks
+        ]
+
+        messages = []
+        errors = []
+        for chunk, future in zip(chunks, futures):
+            try:
+                messages.extend(future.result())
+            except AppleScriptError as e:
+                logger.error("Failed to read %d messages: %s", len(chunk), e)
+                errors.append(e)
+                messages.extend({"id": msg_id, "error": str(e)} for msg_id in chunk)
+        if len(errors) == len(chunks):
+            raise errors[0]
 
     logger.info(
         "Read %d messages from %s/%s", len(messages), account_name, mailbox_path
@@ -307,9 +714,13 @@ def search_messages(
     subject_contains: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    return_total: bool = True,
+    body_contains: str | None = None,
+    index: MailIndex | None = None,
+    as_dict: bool = False,
 ) -> PaginatedMessages:
     """
-    Search messages by sender and/or subject.
+    Search messages by sender, subject and/or body.
 
     Args:
         executor: The AppleScript executor instance
@@ -319,43 +730,82 @@ def search_messages(
         subject_contains: Filter by subject containing this string
         limit: Maximum number of messages to return
         offset: Number of messages to skip (for pagination)
+        return_total: Count the matching messages (see list_messages)
+        body_contains: Filter by body containing this string
+        index: Local search index; used instead of a Mail.app whose-scan when
+            the mailbox has been indexed (see index_mailbox)
+        as_dict: Return the messages as plain dicts instead of dataclasses
 
     Returns:
         PaginatedMessages dict with messages list and pagination metadata
     """
+    if index is not None and index.is_indexed(account_name, mailbox_path):
+        return _search_index(
+            executor, index, account_name, mailbox_path,
+            sender_contains, subject_contains, body_contains, limit, offset, as_dict,
+        )
+
     script = Scripts.search_messages(
-        account_name, mailbox_path, sender_contains, subject_contains, limit, offset
+        account_name, mailbox_path, sender_contains, subject_contains, limit, offset,
+        return_total, body_contains
     )
-    output = executor.run(script, timeout=120)
+    total, _, rows = _parse_summary_stream(executor.stream(script, timeout=120))
+    messages = rows if as_dict else [MessageSummary(**row) for row in rows]
 
-    # Extract total count
-    total, output = _parse_total_count(output)
+    logger.info(
+        "Search found %d messages in %s/%s (total: %d)", len(messages), account_name, mailbox_path, total
+    )
 
-    messages: list[MessageSummary] = []
-    for line in output.strip().split("\n"):
-        if not line.strip():
-            continue
+    return {
+        "messages": messages,
+        "total": total,
+        "offset": offset,
+        "limit": limit,
+        "has_more": _has_more(offset, limit, len(messages), total),
+        "cursor": None,
+    }
 
-        parts = line.split(RECORD_SEP)
-        if len(parts) >= 6:
-            try:
-                msg_id = int(parts[0].strip())
-            except ValueError:
-                continue
 
-            messages.append(
-                MessageSummary(
-                    id=msg_id,
-                    subject=parts[1].strip(),
-                    sender=parts[2].strip(),
-                    date=parts[3].strip(),
-                    is_read=parts[4].strip().lower() == "true",
-                    is_flagged=parts[5].strip().lower() == "true",
-                )
-            )
+def _search_index(
+    executor: AppleScriptExecutor,
+    index: MailIndex,
+    account_name: str,
+    mailbox_path: str,
+    sender_contains: str | None,
+    subject_contains: str | None,
+    body_contains: str | None,
+    limit: int,
+    offset: int,
+    as_dict: bool,
+) -> PaginatedMessages:
+    """Search via the local index, then fetch current headers from Mail."""
+    ids, total = index.search(
+        account_name, mailbox_path, sender_contains, subject_contains, body_contains,
+        limit, offset,
+    )
+
+    messages: list[MessageSummary] | list[dict] = []
+    if ids:
+        # Read/flagged status may have changed since indexing; messages that
+        # no longer exist come back as errors and are dropped
+        for msg in read_messages(
+            executor, account_name, mailbox_path, ids, headers_only=True, as_dict=True
+        ):
+            if "error" in msg:
+                continue
+            row = {
+                "id": msg["id"],
+                "subject": msg["subject"],
+                "sender": msg["sender"],
+                "date": msg["date"],
+                "is_read": msg["is_read"],
+                "is_flagged": msg["is_flagged"],
+            }
+            messages.append(row if as_dict else MessageSummary(**row))
 
     logger.info(
-        "Search found %d messages in %s/%s (total: %d)", len(messages), account_name, mailbox_path, total
+        "Index search found %d messages in %s/%s (total: %d)",
+        len(messages), account_name, mailbox_path, total,
     )
 
     return {
@@ -363,5 +813,49 @@ def search_messages(
         "total": total,
         "offset": offset,
         "limit": limit,
-        "has_more": offset + len(messages) < total,
+        "has_more": offset + len(ids) < total,
+        "cursor": None,
     }
+
+
+def index_mailbox(
+    executor: AppleScriptExecutor,
+    index: MailIndex,
+    account_name: str,
+    mailbox_path: str,
+    batch_size: int = 50,
+    content_limit: int | None = None,
+) -> int:
+    """
+    Build or rebuild the local search index for a mailbox.
+
+    Pages through the mailbox with list_messages(include_content=True) and
+    replaces the mailbox's rows in the index once every page has been
+    fetched; if a fetch fails the previous index of the mailbox is kept.
+    Messages that arrive later are not searchable through the index until it
+    is rebuilt, and moves and status changes drop the mailbox from the index.
+
+    Args:
+        executor: The AppleScript executor instance
+        index: The index to populate
+        account_name: Name of the mail account
+        mailbox_path: Path to the mailbox
+        batch_size: Messages fetched per AppleScript call
+        content_limit: Maximum characters of each body to index (None = full)
+
+    Returns:
+        Number of messages indexed
+    """
+    def pages() -> Iterator[Message]:
+        offset = 0
+        while True:
+            page = list_messages(
+                executor, account_name, mailbox_path, batch_size, offset,
+                include_content=True, content_limit=content_limit, return_total=False,
+            )
+            yield from page["messages"]
+            if not page["has_more"]:
+                return
+            offset += batch_size
+
+    return index.replace_mailbox(account_name, mailbox_path, pages())
@@ -2,9 +2,10 @@
 
 import logging
 
-from ..applescript import RECORD_SEP
+from ..applescript import RECORD_SEP, split_rows
 from ..applescript.executor import AppleScriptExecutor
 from ..applescript.scripts import Scripts
+from .messages import index_hint, index_hints, invalidate_mailbox
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,7 @@ def move_message(
     mailbox_path: str,
     message_id: int,
     destination_mailbox: str,
+    resolve_new_id: bool = True,
 ) -> dict:
     """
     Move a message to another mailbox.
@@ -25,14 +27,20 @@ def move_message(
         mailbox_path: Source mailbox path
         message_id: AppleScript message ID
         destination_mailbox: Destination mailbox path
+        resolve_new_id: Look up the message's new ID after the move
 
     Returns:
         Dict with success status
     """
     script = Scripts.move_message(
-        account_name, mailbox_path, message_id, destination_mailbox
+        account_name, mailbox_path, message_id, destination_mailbox, resolve_new_id,
+        index_hint(account_name, mailbox_path, message_id),
     )
-    output = executor.run(script)
+    try:
+        output = executor.run(script)
+    finally:
+        invalidate_mailbox(account_name, mailbox_path)
+        invalidate_mailbox(account_name, destination_mailbox)
 
     # Parse the new message ID from output (format: "moved{RECORD_SEP}{new_id}")
     new_id = None
@@ -86,35 +94,43 @@ def set_message_status(
         Dict with success status and what was changed
     """
     changes = []
+    base = {
+        "account_name": account_name,
+        "mailbox_path": mailbox_path,
+        "message_id": message_id,
+        "index_hint": index_hint(account_name, mailbox_path, message_id),
+    }
 
     if read_status is not None:
-        script = Scripts.set_read_status(
-            account_name, mailbox_path, message_id, read_status
-        )
-        executor.run(script)
-        status_str = "read" if read_status else "unread"
-        changes.append(f"marked as {status_str}")
-        logger.info(
-            "Set message %d in '%s/%s' to %s",
-            message_id,
-            account_name,
-            mailbox_path,
-            status_str,
-        )
-
+        changes.append(f"marked as {'read' if read_status else 'unread'}")
     if flagged_status is not None:
-        script = Scripts.set_flagged_status(
-            account_name, mailbox_path, message_id, flagged_status
+        changes.append("flagged" if flagged_status else "unflagged")
+
+    # Both updates resolve the message once in a single script
+    if read_status is not None and flagged_status is not None:
+        script = Scripts.set_read_and_flagged_status(
+            **base, read=read_status, flagged=flagged_status
         )
-        executor.run(script)
-        status_str = "flagged" if flagged_status else "unflagged"
-        changes.append(status_str)
+    elif read_status is not None:
+        script = Scripts.set_read_status(**base, read=read_status)
+    elif flagged_status is not None:
+        script = Scripts.set_flagged_status(**base, flagged=flagged_status)
+    else:
+        script = None
+
+    if script is not None:
+        try:
+            executor.run(script)
+        finally:
+            invalidate_mailbox(account_name, mailbox_path)
+
+    for change in changes:
         logger.info(
-            "Set message %d in '%s/%s' to %s",
+            "Message %d in '%s/%s' %s",
             message_id,
             account_name,
             mailbox_path,
-            status_str,
+            change,
         )
 
     if not changes:
@@ -135,6 +151,7 @@ def bulk_move_messages(
     mailbox_path: str,
     message_ids: list[int],
     destination_mailbox: str,
+    resolve_new_ids: bool = True,
 ) -> dict:
     """
     Move multiple messages to another mailbox.
@@ -145,47 +162,59 @@ def bulk_move_messages(
         mailbox_path: Source mailbox path
         message_ids: List of message IDs to move
         destination_mailbox: Destination mailbox path
+        resolve_new_ids: Look up each message's new ID after the move. Skipping
+            this avoids a scan of the destination mailbox per message.
 
     Returns:
         Dict with success count and details of moved messages
     """
+    if not message_ids:
+        return {
+            "success": True,
+            "moved_count": 0,
+            "error_count": 0,
+            "total": 0,
+            "results": [],
+        }
+
     script = Scripts.bulk_move_messages(
-        account_name, mailbox_path, message_ids, destination_mailbox
+        account_name, mailbox_path, message_ids, destination_mailbox, resolve_new_ids,
+        index_hints(account_name, mailbox_path, message_ids),
     )
-    output = executor.run(script, timeout=120)
+    try:
+        output = executor.run(script, timeout=120)
+    finally:
+        invalidate_mailbox(account_name, mailbox_path)
+        invalidate_mailbox(account_name, destination_mailbox)
 
     results = []
     success_count = 0
     error_count = 0
 
-    for line in output.strip().split("\n"):
-        if not line.strip():
+    # Rows of old id, new id (empty when not resolved) and status
+    fields = split_rows(output, 3)
+    for k in range(0, len(fields), 3):
+        try:
+            old_id = int(fields[k])
+            new_id = fields[k + 1]
+            status = fields[k + 2]
+
+            if status == "success":
+                result = {"old_id": old_id, "success": True}
+                if new_id:
+                    result["new_id"] = int(new_id)
+                success_count += 1
+                results.append(result)
+            else:
+                error_count += 1
+                results.append({
+                    "old_id": old_id,
+                    "success": False,
+                    "error": status,
+                })
+        except ValueError:
             continue
 
-        parts = line.split(RECORD_SEP)
-        if len(parts) >= 3:
-            try:
-                old_id = int(parts[0].strip())
-                new_id = int(parts[1].strip())
-                status = parts[2].strip()
-
-                if status == "success":
-                    success_count += 1
-                    results.append({
-                        "old_id": old_id,
-                        "new_id": new_id,
-                        "success": True,
-                    })
-                else:
-                    error_count += 1
-                    results.append({
-                        "old_id": old_id,
-                        "success": False,
-                        "error": status,
-                    })
-            except ValueError:
-                continue
-
     logger.info(
         "Bulk moved %d/%d messages from '%s/%s' to '%s'",
         success_count,
@@ -226,46 +255,45 @@ def bulk_set_status(
     Returns:
         Dict with success status and counts
     """
-    results = []
-
+    changes = []
     if read_status is not None:
-        script = Scripts.bulk_set_read_status(
-            account_name, mailbox_path, message_ids, read_status
-        )
-        output = executor.run(script, timeout=120)
-        status_str = "read" if read_status else "unread"
-        results.append(f"marked {status_str}: {output}")
-        logger.info(
-            "Bulk set %d messages in '%s/%s' to %s",
-            len(message_ids),
-            account_name,
-            mailbox_path,
-            status_str,
-        )
-
+        changes.append("marked read" if read_status else "marked unread")
     if flagged_status is not None:
-        script = Scripts.bulk_set_flagged_status(
-            account_name, mailbox_path, message_ids, flagged_status
-        )
-        output = executor.run(script, timeout=120)
-        status_str = "flagged" if flagged_status else "unflagged"
-        results.append(f"{status_str}: {output}")
-        logger.info(
-            "Bulk set %d messages in '%s/%s' to %s",
-            len(message_ids),
-            account_name,
-            mailbox_path,
-            status_str,
-        )
+        changes.append("flagged" if flagged_status else "unflagged")
 
-    if not results:
+    if not changes:
         return {
             "success": True,
             "message": "No changes requested",
         }
+    if not message_ids:
+        return {
+            "success": True,
+            "message": "No messages given",
+            "total_messages": 0,
+        }
+
+    # Both statuses are applied in the same pass over the messages
+    script = Scripts.bulk_set_flags(
+        account_name, mailbox_path, message_ids, read_status, flagged_status,
+        index_hints(account_name, mailbox_path, message_ids),
+    )
+    try:
+        output = executor.run(script, timeout=120)
+    finally:
+        invalidate_mailbox(account_name, mailbox_path)
+
+    summary = ", ".join(changes)
+    logger.info(
+        "Bulk set %d messages in '%s/%s' to %s",
+        len(message_ids),
+        account_name,
+        mailbox_path,
+        summary,
+    )
 
     return {
         "success": True,
-        "message": "; ".join(results),
+        "message": f"{summary}: {output}",
         "total_messages": len(message_ids),
     }
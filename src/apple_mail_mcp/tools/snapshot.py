@@ -0,0 +1,67 @@
+"""Account overview tool: mailboxes plus their first messages in one call."""
+
+import logging
+from typing import TypedDict
+
+from ..applescript import GROUP_SEP
+from ..applescript.executor import AppleScriptExecutor
+from ..applescript.scripts import Scripts
+from .mailboxes import Mailbox, _iter_mailboxes
+from .messages import MessageSummary, _iter_summaries, _remember_positions
+
+logger = logging.getLogger(__name__)
+
+
+class Snapshot(TypedDict):
+    """Mailboxes of an account and the first messages of each mailbox."""
+    mailboxes: list[Mailbox] | list[dict]
+    messages: dict[str, list[MessageSummary] | list[dict]]
+
+
+def account_snapshot(
+    executor: AppleScriptExecutor,
+    account_name: str,
+    messages_per_mailbox: int = 10,
+    as_dict: bool = False,
+) -> Snapshot:
+    """
+    List an account's mailboxes with the first messages of each, in one script.
+
+    Equivalent to list_mailboxes followed by list_messages(limit=
+    messages_per_mailbox) for every mailbox, without a round trip per mailbox.
+
+    Args:
+        executor: The AppleScript executor instance
+        account_name: Name of the mail account
+        messages_per_mailbox: Message summaries to include per mailbox (0 for none)
+        as_dict: Return plain dicts instead of dataclasses
+
+    Returns:
+        Snapshot dict with the mailboxes (nested, as list_mailboxes) and the
+        message summaries keyed by mailbox path
+    """
+    script = Scripts.account_snapshot(account_name, messages_per_mailbox)
+    output = executor.run(script, timeout=120)
+
+    result: Snapshot = {"mailboxes": [], "messages": {}}
+    for block in output.split(GROUP_SEP):
+        header, _, rows = block.strip("\n").partition("\n")
+        mailbox = next(_iter_mailboxes(header), None)
+        if mailbox is None:
+            continue
+
+        summaries = list(_iter_summaries(rows))
+        # The summaries are the mailbox's first page, like an unfiltered list_messages
+        _remember_positions(account_name, mailbox["path"], 0, [row["id"] for row in summaries])
+
+        if as_dict:
+            result["mailboxes"].append(mailbox)
+            result["messages"][mailbox["path"]] = summaries
+        else:
+            result["mailboxes"].append(Mailbox(**mailbox))
+            result["messages"][mailbox["path"]] = [MessageSummary(**row) for row in summaries]
+
+    logger.info(
+        "Snapshot of '%s': %d mailboxes", account_name, len(result["mailboxes"])
+    )
+    return result
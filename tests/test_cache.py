@@ -0,0 +1,158 @@
+"""Tests for the TTL cache and single-flight call sharing."""
+
+import threading
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+from apple_mail_mcp import cache as cache_module
+from apple_mail_mcp.cache import SingleFlight, TTLCache
+
+
+class TTLCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 100.0
+        patch = mock.patch.object(cache_module.time, "monotonic", lambda: self.now)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.cache = TTLCache()
+
+    def test_value_expires_after_ttl(self):
+        self.cache.set(("accounts",), ["Work"])
+        self.now += 10
+        self.assertEqual(self.cache.get(("accounts",), 15), ["Work"])
+        self.now += 10
+        self.assertIsNone(self.cache.get(("accounts",), 15))
+
+    def test_ttl_is_given_per_lookup(self):
+        self.cache.set(("accounts",), ["Work"])
+        self.now += 10
+        self.assertIsNone(self.cache.get(("accounts",), 5))
+
+    def test_invalidate_drops_keys_with_prefix(self):
+        self.cache.set(("messages", "Work", "INBOX"), 1)
+        self.cache.set(("messages", "Home", "INBOX"), 2)
+        self.cache.invalidate("messages", "Work")
+        self.assertIsNone(self.cache.get(("messages", "Work", "INBOX"), 15))
+        self.assertEqual(self.cache.get(("messages", "Home", "INBOX"), 15), 2)
+
+    def test_value_computed_before_invalidation_is_not_stored(self):
+        key = ("messages", "Work", "INBOX")
+        generation = self.cache.generation(key)
+        self.cache.invalidate("messages", "Work")
+        self.cache.set(key, "stale", generation)
+        self.assertIsNone(self.cache.get(key, 15))
+
+    def test_unrelated_invalidation_keeps_generation(self):
+        key = ("messages", "Work", "INBOX")
+        generation = self.cache.generation(key)
+        self.cache.invalidate("messages", "Home")
+        self.cache.set(key, "fresh", generation)
+        self.assertEqual(self.cache.get(key, 15), "fresh")
+
+    def test_clear_changes_every_generation(self):
+        key = ("mailboxes", "Work", True)
+        generation = self.cache.generation(key)
+        self.cache.clear()
+        self.cache.set(key, "stale", generation)
+        self.assertIsNone(self.cache.get(key, 15))
+
+
+class SingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.waiting = threading.Event()
+        self.calls = 0
+
+        waiting = self.waiting
+
+        class SignallingFuture(Future):
+            def result(self, timeout=None):
+                # Only followers ask for the result; once this is reached the
+                # follower is bound to the leader's call
+                waiting.set()
+                return super().result(timeout)
+
+        patch = mock.patch.object(cache_module, "Future", SignallingFuture)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.flight = SingleFlight()
+
+    def slow(self, outcome):
+        def fn():
+            self.calls += 1
+            self.started.set()
+            self.release.wait(5)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return fn
+
+    def follow(self, results: list) -> threading.Thread:
+        """Start a second caller of the key once the leader is running."""
+        def run():
+            try:
+                results.append(self.flight.do(("key",), self.slow("follower ran")))
+            except Exception as e:
+                results.append(e)
+
+        self.started.wait(5)
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    def lead(self, outcome, results: list) -> threading.Thread:
+        def run():
+            try:
+                results.append(self.flight.do(("key",), self.slow(outcome)))
+            except Exception as e:
+                results.append(e)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    def wait_for_follower(self):
+        self.assertTrue(self.waiting.wait(5), "follower did not wait for the leader")
+
+    def test_concurrent_callers_share_one_call(self):
+        leader_results, follower_results = [], []
+        leader = self.lead("result", leader_results)
+        follower = self.follow(follower_results)
+        self.wait_for_follower()
+        self.release.set()
+        leader.join(5)
+        follower.join(5)
+        self.assertEqual(leader_results, ["result"])
+        self.assertEqual(follower_results, ["result"])
+        self.assertEqual(self.calls, 1)
+
+    def test_followers_see_the_leaders_exception(self):
+        error = ValueError("boom")
+        leader_results, follower_results = [], []
+        leader = self.lead(error, leader_results)
+        follower = self.follow(follower_results)
+        self.wait_for_follower()
+        self.release.set()
+        leader.join(5)
+        follower.join(5)
+        self.assertEqual(leader_results, [error])
+        self.assertEqual(follower_results, [error])
+        self.assertEqual(self.calls, 1)
+
+    def test_later_call_runs_again(self):
+        self.release.set()
+        self.assertEqual(self.flight.do(("key",), lambda: 1), 1)
+        self.assertEqual(self.flight.do(("key",), lambda: 2), 2)
+        self.assertEqual(self.flight._calls, {})
+
+    def test_failed_call_is_not_remembered(self):
+        self.release.set()
+        with self.assertRaises(ValueError):
+            self.flight.do(("key",), self.slow(ValueError("boom")))
+        self.assertEqual(self.flight.do(("key",), lambda: "ok"), "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+"""Tests for splitting RECORD_SEP/linefeed script output into fields."""
+
+import unittest
+
+from apple_mail_mcp.applescript.escape import RECORD_SEP, split_rows
+
+
+def rows(*lines: tuple[str, ...]) -> str:
+    return "\n".join(RECORD_SEP.join(line) for line in lines)
+
+
+class SplitRowsTest(unittest.TestCase):
+    def test_well_formed_rows(self):
+        output = rows(("1", "INBOX", "3"), ("2", "Archive", "0")) + "\n"
+        self.assertEqual(split_rows(output, 3), ["1", "INBOX", "3", "2", "Archive", "0"])
+
+    def test_rows_with_wrong_field_counts_are_dropped(self):
+        # 2 + 4 fields add up to two rows of 3 but must not be realigned
+        output = rows(("a", "1"), ("b", "3", "4", "x"))
+        with self.assertLogs("apple_mail_mcp.applescript.escape", "WARNING"):
+            self.assertEqual(split_rows(output, 3), [])
+
+    def test_good_rows_around_a_bad_one_are_kept(self):
+        output = rows(("a", "1", "2"), ("b", "3"), ("c", "5", "6"))
+        with self.assertLogs("apple_mail_mcp.applescript.escape", "WARNING"):
+            self.assertEqual(split_rows(output, 3), ["a", "1", "2", "c", "5", "6"])
+
+    def test_empty_output(self):
+        self.assertEqual(split_rows("\n", 3), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+"""Tests for parsing and caching message listings."""
+
+import unittest
+from unittest import mock
+
+from apple_mail_mcp.applescript import GROUP_SEP, RECORD_SEP, UNIT_SEP
+from apple_mail_mcp.tools import mailboxes, messages
+from apple_mail_mcp.tools.messages import (
+    _content_end,
+    _iter_message_records,
+    _parse_summary_stream,
+    _window_page,
+    invalidate_mailbox,
+)
+
+
+def record(msg_id: int, subject: str, content: str, length: int | None = None) -> str:
+    """A full-message record as read_messages' script prints it."""
+    if length is None:
+        length = len(content)
+    headers = [str(msg_id), subject, "a@example.com", "b@example.com", "", "Monday", "true", "false"]
+    return UNIT_SEP.join(headers) + UNIT_SEP + f"{length}:{content}" + GROUP_SEP
+
+
+def error_record(msg_id: int, message: str) -> str:
+    return f"{msg_id}{UNIT_SEP}ERROR{UNIT_SEP}{message}{GROUP_SEP}"
+
+
+def summary(msg_id: int, subject: str) -> str:
+    return RECORD_SEP.join([str(msg_id), subject, "a@example.com", "Monday", "false", "true"])
+
+
+class ContentEndTest(unittest.TestCase):
+    def test_exact_length(self):
+        output = "5:hello" + GROUP_SEP
+        self.assertEqual(_content_end(output, 2, 5), 7)
+
+    def test_length_past_end_of_output(self):
+        self.assertEqual(_content_end("5:hi", 2, 5), 4)
+
+
+class IterMessageRecordsTest(unittest.TestCase):
+    def contents(self, output: str) -> list[str]:
+        return [fields[-1] for fields in _iter_message_records(output)]
+
+    def test_group_sep_inside_content(self):
+        body = f"before{GROUP_SEP}after{UNIT_SEP}x"
+        output = record(1, "One", body) + record(2, "Two", "second")
+        self.assertEqual(self.contents(output), [body, "second"])
+
+    def test_non_bmp_length_mismatch(self):
+        # The ZWJ sequence is one AppleScript character but three code points
+        body = "hi \U0001F469‍\U0001F4BB there"
+        output = record(1, "One", body, length=len(body) - 2) + record(2, "Two", "second")
+        self.assertEqual(self.contents(output), [body, "second"])
+
+    def test_length_too_long_for_last_record(self):
+        output = record(1, "One", "first") + record(2, "Two", "second", length=10)
+        self.assertEqual(self.contents(output), ["first", "second"])
+
+    def test_error_records(self):
+        output = record(1, "One", "first") + error_record(2, "Can't get message.") + record(3, "Three", "third")
+        records = list(_iter_message_records(output))
+        self.assertEqual(records[1], ["2", "ERROR", "Can't get message."])
+        self.assertEqual([r[-1] for r in records], ["first", "Can't get message.", "third"])
+
+    def test_wrong_length_with_record_like_text_in_content(self):
+        # The GS inside the content is followed by digits and US, like the
+        # start of a record, and is closer to the (wrong) length than the
+        # real end of the content
+        body = f"ab{GROUP_SEP}7{UNIT_SEP}cd"
+        output = record(1, "One", body, length=3) + record(2, "Two", "second")
+        self.assertEqual(self.contents(output), [body, "second"])
+
+    def test_unframed_content(self):
+        headers = UNIT_SEP.join(["1", "One", "a", "b", "", "Monday", "true", "false"])
+        output = headers + UNIT_SEP + "no prefix" + GROUP_SEP
+        self.assertEqual(self.contents(output), ["no prefix"])
+
+
+class ParseSummaryStreamTest(unittest.TestCase):
+    def test_single_chunk(self):
+        chunk = "TOTAL:2\nCURSOR:2024-05-01T09:00:00\n" + summary(1, "One") + "\n" + summary(2, "Two")
+        total, cursor, rows = _parse_summary_stream([chunk])
+        self.assertEqual((total, cursor), (2, "2024-05-01T09:00:00"))
+        self.assertEqual([row["subject"] for row in rows], ["One", "Two"])
+        self.assertEqual(rows[0]["is_flagged"], True)
+
+    def test_total_and_cursor_in_separate_chunks(self):
+        chunks = ["TOTAL:3", "CURSOR:2024-05-01T09:00:00", summary(1, "One"), summary(2, "Two")]
+        total, cursor, rows = _parse_summary_stream(chunks)
+        self.assertEqual((total, cursor), (3, "2024-05-01T09:00:00"))
+        self.assertEqual([row["id"] for row in rows], [1, 2])
+
+    def test_without_cursor(self):
+        total, cursor, rows = _parse_summary_stream(["TOTAL:1\n" + summary(7, "Seven")])
+        self.assertEqual((total, cursor), (1, None))
+        self.assertEqual([row["id"] for row in rows], [7])
+
+    def test_empty_output(self):
+        self.assertEqual(_parse_summary_stream([]), (0, None, []))
+
+
+class WindowPageTest(unittest.TestCase):
+    """_window_page against a fake mailbox of MAILBOX_SIZE messages."""
+
+    MAILBOX_SIZE = 200
+
+    def setUp(self):
+        self.fetches: list[tuple[int, int]] = []
+        messages._windows.clear()
+        messages._generations.clear()
+        patches = [
+            mock.patch.object(messages, "_fetch_page", self.fake_fetch_page),
+            mock.patch.object(messages, "drop_mailbox"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def fake_fetch_page(self, executor, account_name, mailbox_path, limit, offset, *args):
+        self.fetches.append((limit, offset))
+        ids = range(offset + 1, min(offset + limit, self.MAILBOX_SIZE) + 1)
+        return self.MAILBOX_SIZE, None, [{"id": i} for i in ids]
+
+    def page(self, limit: int, offset: int, mailbox_path: str = "INBOX", return_total: bool = True):
+        return _window_page(None, "Work", mailbox_path, limit, offset, False, False, return_total)
+
+    def test_pages_within_the_window_share_one_fetch(self):
+        total, rows, has_more = self.page(10, 0)
+        self.assertEqual((total, [r["id"] for r in rows], has_more), (200, list(range(1, 11)), True))
+        _, rows, _ = self.page(10, 10)
+        self.assertEqual([r["id"] for r in rows], list(range(11, 21)))
+        self.assertEqual(self.fetches, [(messages.WINDOW_MIN_SIZE, 0)])
+
+    def test_window_grows_to_the_next_power_of_two(self):
+        self.page(10, 0)
+        _, rows, has_more = self.page(50, 60)
+        self.assertEqual([r["id"] for r in rows], list(range(61, 111)))
+        self.assertTrue(has_more)
+        self.assertEqual(self.fetches, [(64, 0), (128, 0)])
+
+    def test_last_page(self):
+        _, rows, has_more = self.page(50, 180)
+        self.assertEqual([r["id"] for r in rows], list(range(181, 201)))
+        self.assertFalse(has_more)
+
+    def test_invalidate_mailbox_refetches(self):
+        self.page(10, 0)
+        invalidate_mailbox("Work", "INBOX")
+        self.page(10, 0)
+        self.assertEqual(len(self.fetches), 2)
+        messages.drop_mailbox.assert_called_once_with("Work", "INBOX")
+
+    def test_invalidating_another_mailbox_keeps_the_window(self):
+        self.page(10, 0)
+        invalidate_mailbox("Work", "Archive")
+        self.page(10, 0)
+        self.assertEqual(len(self.fetches), 1)
+
+    def test_expired_window_is_refetched(self):
+        with mock.patch.object(messages.time, "monotonic", return_value=1000.0):
+            self.page(10, 0)
+        with mock.patch.object(messages.time, "monotonic", return_value=1000.0 + messages.WINDOW_TTL + 1):
+            self.page(10, 0)
+        self.assertEqual(len(self.fetches), 2)
+
+    def test_rename_mailbox_invalidates_old_and_new_path(self):
+        self.page(10, 0, "Projects/Old")
+        self.page(10, 0, "Projects/New")
+        executor = mock.Mock()
+        mailboxes.rename_mailbox(executor, "Work", "Projects/Old", "New")
+        self.page(10, 0, "Projects/Old")
+        self.page(10, 0, "Projects/New")
+        self.assertEqual(len(self.fetches), 4)
+
+    def test_create_mailbox_invalidates_its_path(self):
+        self.page(10, 0, "Projects/New")
+        mailboxes.create_mailbox(mock.Mock(), "Work", "New", "Projects")
+        self.page(10, 0, "Projects/New")
+        self.assertEqual(len(self.fetches), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()